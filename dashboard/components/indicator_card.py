@@ -4,31 +4,14 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import logging
-from datetime import datetime
+
+from dashboard.utils.data_loader import get_valid_update_date
+from dashboard.utils.data_processor import format_metric_value, format_change, get_impact_indicator
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def get_valid_update_date(date_value):
-    """Ensure the last updated date is not in the future."""
-    try:
-        # Convert to datetime if it's not already
-        if not isinstance(date_value, datetime):
-            date_value = pd.to_datetime(date_value)
-        
-        # Check if date is in the future
-        now = datetime.now()
-        if date_value > now:
-            # Return current date if future date detected
-            logger.warning(f"Future date detected: {date_value}. Using current date instead.")
-            return now.strftime('%b %d, %Y')
-        
-        return date_value.strftime('%b %d, %Y')
-    except Exception as e:
-        logger.error(f"Error formatting date: {e}")
-        return "Unknown"
-
 def create_indicator_card(indicator_id, indicator_info, show_forecast=True, use_absolute=False):
     """Create a standardized card for displaying an economic indicator with improved error handling."""
     if indicator_info is None:
@@ -174,7 +157,7 @@ def create_indicator_card(indicator_id, indicator_info, show_forecast=True, use_
             # If forecasts are available and requested, add them to the chart
             if show_forecast:
                 from dashboard.utils.data_loader import load_forecast_data
-                forecast_info = load_forecast_data(indicator_id)
+                forecast_info = load_forecast_data(indicator_id, df)
                 if forecast_info and isinstance(forecast_info, tuple) and len(forecast_info) > 0:
                     forecast_df = forecast_info[0]
                     if not forecast_df.empty:
@@ -199,7 +182,7 @@ def create_indicator_card(indicator_id, indicator_info, show_forecast=True, use_
         if show_forecast:
             from dashboard.utils.data_loader import load_forecast_data
             try:
-                forecast_info = load_forecast_data(indicator_id)
+                forecast_info = load_forecast_data(indicator_id, df)
                 if forecast_info and isinstance(forecast_info, tuple) and len(forecast_info) > 0:
                     forecast_df = forecast_info[0]
                     if not forecast_df.empty and len(forecast_df) > 0:
@@ -286,94 +269,6 @@ def create_indicator_card(indicator_id, indicator_info, show_forecast=True, use_
         logger.error(f"Error rendering indicator card for {indicator_id}: {e}")
         st.warning(f"Error displaying indicator card for {indicator_id}")
 
-def format_metric_value(value, unit=''):
-    """Format metric value with appropriate unit."""
-    if pd.isna(value):
-        return "N/A"
-    
-    if unit == '$':
-        return f"${value:.2f}"
-    elif unit == '%':
-        return f"{value:.2f}%"
-    else:
-        return f"{value:.2f}"
-
-def format_change(change, preferred_direction='neutral', use_absolute=False):
-    """Format change value with appropriate color and sign."""
-    if pd.isna(change):
-        return "N/A", "neutral-change"
-    
-    # For certain metrics like supply chain index, use absolute change
-    if use_absolute:
-        sign = "+" if change > 0 else ""
-        if preferred_direction == 'down':
-            style = "negative-change" if change > 0 else "positive-change"
-        elif preferred_direction == 'up':
-            style = "positive-change" if change > 0 else "negative-change"
-        else:  # neutral
-            style = "neutral-change"
-        
-        return f"{sign}{change:.2f}", style
-    else:
-        # Use percentage for other metrics
-        sign = "+" if change > 0 else ""
-        if preferred_direction == 'down':
-            style = "negative-change" if change > 0 else "positive-change"
-        elif preferred_direction == 'up':
-            style = "positive-change" if change > 0 else "negative-change"
-        else:  # neutral
-            style = "neutral-change"
-        
-        return f"{sign}{change:.2f}%", style
-
-def get_impact_indicator(change, preferred_direction='neutral', use_absolute=False, indicator_id=None):
-    """Return impact indicator (↑/↓) with styling classes, properly accounting for business impact."""
-    if pd.isna(change):
-        return "", "neutral-impact", "neutral"
-    
-    # Set significance thresholds - these determine when a change is significant enough to have an impact
-    significance_threshold = 2.0  # Default for percentage changes
-    
-    if use_absolute:
-        significance_threshold = 0.1  # Different threshold for absolute changes (like supply chain index)
-    
-    # Check if the change is significant
-    is_significant = abs(change) > significance_threshold
-    
-    # Handle special cases for specific indicators
-    if indicator_id:
-        # For commodity prices like oil, significant decreases are positive for most businesses (reduced costs)
-        if indicator_id in ['wti_oil', 'ppi_steel_scrap']:
-            preferred_direction = 'down'
-        
-        # For dollar index, weaker dollar (going down) tends to help US exporters
-        elif indicator_id == 'dollar_index':
-            preferred_direction = 'down'
-        
-        # For Baltic Dry Index, changes indicate shipping cost changes, lower is generally better
-        elif indicator_id == 'baltic_dry_index':
-            preferred_direction = 'down'
-    
-    if preferred_direction == 'down':
-        # For metrics where decrease is good (like supply chain pressure, costs)
-        impact = "positive" if change < 0 else ("negative" if is_significant else "neutral")
-        indicator = "↓" if change < 0 else "↑"
-    elif preferred_direction == 'up':
-        # For metrics where increase is good
-        impact = "positive" if change > 0 else ("negative" if is_significant else "neutral")
-        indicator = "↑" if change > 0 else "↓"
-    else:  # neutral
-        # Even for neutral preference indicators, significant movements should have impact
-        if is_significant:
-            # Default to cost perspective - increases in most indicators imply higher costs
-            impact = "negative" if change > 0 else "positive"
-        else:
-            impact = "neutral"
-        indicator = "↑" if change > 0 else "↓"
-    
-    style_class = f"{impact}-impact"
-    return indicator, style_class, impact
-
 def highlight_latest_value(df, chart_container):
     """Highlight the latest value in the chart."""
     if not df.empty and 'Date' in df.columns and 'value' in df.columns:
@@ -31,7 +31,7 @@ if project_root not in sys.path:
 try:
     from dashboard.utils.styling import get_css
     from dashboard.utils.data_loader import load_all_indicators
-    from dashboard.utils.data_processor import filter_time_period, download_link
+    from dashboard.utils.data_processor import filter_time_period, download_link, latest_snapshot, generate_automated_commentary
     from dashboard.components.indicator_card import create_indicator_card
     from dashboard.pages.correlation_page import show_correlation_page
     from dashboard.pages.cost_indicators_page import show_cost_indicators_page
@@ -83,33 +83,40 @@ st.session_state['forecast_toggle'] = forecast_toggle
 st.sidebar.markdown('<h2 class="sidebar-title">Download Data</h2>', unsafe_allow_html=True)
 st.sidebar.markdown('<p class="sidebar-text">Download the raw data for each indicator:</p>', unsafe_allow_html=True)
 
-# Group indicators by category for better organization
-standard_indicators = {k: v for k, v in all_indicators.items() if not any(x in k for x in ['equipment', 'steel', 'cement', 'explosives'])}
-cost_indicators = {k: v for k, v in all_indicators.items() if k not in standard_indicators}
+# Group indicators by category for better organization and encode their
+# CSV download links only when the loaded data changes; ``data_signature``
+# identifies the contents, ``_all_indicators`` is excluded from hashing
+@st.cache_data(show_spinner=False)
+def build_download_links(data_signature, _all_indicators):
+    standard_links, cost_links = [], []
+    for indicator_id, *_ in data_signature:
+        df = _all_indicators[indicator_id][0]
+        if df.empty:
+            continue
+        source_name = df['source'].iloc[0] if 'source' in df.columns else indicator_id.replace('_', ' ').title()
+        links = cost_links if any(x in indicator_id for x in ['equipment', 'steel', 'cement', 'explosives']) else standard_links
+        links.append(download_link(df, f"{indicator_id}.csv", f"{source_name}"))
+    return standard_links, cost_links
+
+data_signature = tuple(
+    (indicator_id, len(df),
+     df['Date'].iat[-1] if not df.empty and 'Date' in df.columns else None,
+     df['value'].iat[-1] if not df.empty and 'value' in df.columns else None)
+    for indicator_id, (df, *_) in all_indicators.items()
+)
+standard_links, cost_links = build_download_links(data_signature, all_indicators)
 
 # Show standard indicators first
-if standard_indicators:
+if standard_links:
     st.sidebar.markdown('<p class="sidebar-text"><strong>Standard Indicators:</strong></p>', unsafe_allow_html=True)
-    for indicator_id, df_info in standard_indicators.items():
-        df = df_info[0]
-        if not df.empty:
-            source_name = df['source'].iloc[0] if 'source' in df.columns else indicator_id.replace('_', ' ').title()
-            st.sidebar.markdown(
-                download_link(df, f"{indicator_id}.csv", f"{source_name}"),
-                unsafe_allow_html=True
-            )
+    for link in standard_links:
+        st.sidebar.markdown(link, unsafe_allow_html=True)
 
 # Then show cost indicators
-if cost_indicators:
+if cost_links:
     st.sidebar.markdown('<p class="sidebar-text"><strong>Cost Indicators:</strong></p>', unsafe_allow_html=True)
-    for indicator_id, df_info in cost_indicators.items():
-        df = df_info[0]
-        if not df.empty:
-            source_name = df['source'].iloc[0] if 'source' in df.columns else indicator_id.replace('_', ' ').title()
-            st.sidebar.markdown(
-                download_link(df, f"{indicator_id}.csv", f"{source_name}"),
-                unsafe_allow_html=True
-            )
+    for link in cost_links:
+        st.sidebar.markdown(link, unsafe_allow_html=True)
 
 # Add dashboard selection
 view_options = ["Main Dashboard", "Cost Indicators", "Correlation Analysis"]
@@ -120,65 +127,6 @@ st.sidebar.markdown("---")
 last_updated = datetime.now().strftime("%Y-%m-%d")
 st.sidebar.markdown(f'<p style="font-size:0.8rem; color: #333333;">Last updated: {last_updated}<br>© 2025 Teck Resources</p>', unsafe_allow_html=True)
 
-def generate_automated_commentary(indicator_id, latest_value, monthly_change, yoy_change, forecast_change=None, preferred_direction='neutral'):
-    """Generate automated commentary based on indicator metrics"""
-    
-    commentary = ""
-    
-    if indicator_id == 'supply_chain':
-        if latest_value > 0:
-            level_desc = f"The current value of {latest_value:.2f} indicates above-average supply chain pressure."
-        else:
-            level_desc = f"The current value of {latest_value:.2f} indicates below-average supply chain pressure."
-            
-        if monthly_change < -0.2:
-            monthly_desc = f"Supply chain pressure has notably decreased by {abs(monthly_change):.2f} points over the last month, a positive development."
-        elif monthly_change < 0:
-            monthly_desc = f"Supply chain pressure has slightly decreased by {abs(monthly_change):.2f} points over the last month."
-        elif monthly_change < 0.2:
-            monthly_desc = f"Supply chain pressure has remained relatively stable with a small increase of {monthly_change:.2f} points over the last month."
-        else:
-            monthly_desc = f"Supply chain pressure has increased by {monthly_change:.2f} points over the last month, indicating worsening conditions."
-            
-        if forecast_change:
-            if forecast_change < 0:
-                forecast_desc = f"The forecast indicates improving conditions with a projected {abs(forecast_change):.2f} point decrease in pressure over the next few months."
-            else:
-                forecast_desc = f"The forecast suggests continued challenges with a projected {forecast_change:.2f} point increase in pressure over the next few months."
-        else:
-            forecast_desc = ""
-            
-        commentary = f"{level_desc} {monthly_desc} {forecast_desc}"
-        
-    elif indicator_id == 'empire_prices_paid':
-        if latest_value > 50:
-            level_desc = f"The current Empire Manufacturing Prices Paid index of {latest_value:.2f} indicates increasing input prices for manufacturers in New York state."
-        else:
-            level_desc = f"The current Empire Manufacturing Prices Paid index of {latest_value:.2f} indicates decreasing input prices for manufacturers in New York state."
-            
-        if monthly_change < -1:
-            monthly_desc = f"The index has decreased by {abs(monthly_change):.2f}% month-over-month, suggesting easing price pressures."
-        elif monthly_change < 1:
-            monthly_desc = f"The index has remained relatively stable month-over-month ({monthly_change:.2f}%)."
-        else:
-            monthly_desc = f"The index has increased by {monthly_change:.2f}% month-over-month, suggesting growing price pressures."
-            
-        if yoy_change and not pd.isna(yoy_change):
-            if yoy_change < -5:
-                yoy_desc = f"Year-over-year, prices paid have decreased significantly ({yoy_change:.2f}%), indicating substantial relief in input costs."
-            elif yoy_change < 0:
-                yoy_desc = f"Year-over-year, prices paid have moderated ({yoy_change:.2f}%)."
-            elif yoy_change < 5:
-                yoy_desc = f"Year-over-year, prices paid have increased moderately ({yoy_change:.2f}%)."
-            else:
-                yoy_desc = f"Year-over-year, prices paid have increased significantly ({yoy_change:.2f}%), indicating persistent inflation in input costs."
-        else:
-            yoy_desc = ""
-            
-        commentary = f"{level_desc} {monthly_desc} {yoy_desc}"
-    
-    return commentary
-
 # Main Content based on selected view
 if selected_view == "Main Dashboard":
     # -------------------- Key Economic Indicators --------------------
@@ -209,21 +157,20 @@ if selected_view == "Main Dashboard":
                 create_indicator_card('supply_chain', (supply_chain_data, supply_chain_info[1], supply_chain_info[2]), forecast_toggle, use_absolute=True)
                 
                 # Add automated commentary
-                latest_data = supply_chain_data.iloc[-1]
+                latest_data = latest_snapshot(supply_chain_data)
                 forecast_change = None
                 if forecast_toggle and 'supply_chain' in forecasts:
                     forecast_df = forecasts['supply_chain'][0]
                     if not forecast_df.empty and len(forecast_df) > 0:
-                        last_forecast = forecast_df.iloc[-1]
-                        forecast_change = last_forecast['value'] - latest_data['value']
+                        forecast_change = forecast_df['value'].iat[-1] - latest_data['value']
                 
                 commentary = generate_automated_commentary(
                     'supply_chain', 
                     latest_data['value'], 
-                    latest_data.get('monthly_change', 0),
-                    latest_data.get('yoy_change', 0),
+                    latest_data['monthly_change'],
+                    latest_data['yoy_change'],
                     forecast_change,
-                    latest_data.get('preferred_direction', 'down')
+                    latest_data['preferred_direction']
                 )
                 
                 if commentary:
@@ -237,23 +184,22 @@ if selected_view == "Main Dashboard":
                 create_indicator_card('empire_prices_paid', (empire_data, empire_info[1], empire_info[2]), forecast_toggle)
                 
                 # Add automated commentary
-                latest_data = empire_data.iloc[-1]
+                latest_data = latest_snapshot(empire_data)
                 forecast_change = None
                 if forecast_toggle and 'empire_prices_paid' in forecasts:
                     forecast_df = forecasts['empire_prices_paid'][0]
                     if not forecast_df.empty and len(forecast_df) > 0:
-                        last_forecast = forecast_df.iloc[-1]
-                        forecast_change = last_forecast['value'] - latest_data['value']
+                        forecast_change = forecast_df['value'].iat[-1] - latest_data['value']
                         if latest_data['value'] != 0:
                             forecast_change = (forecast_change / latest_data['value']) * 100
                 
                 commentary = generate_automated_commentary(
                     'empire_prices_paid', 
                     latest_data['value'], 
-                    latest_data.get('monthly_change', 0),
-                    latest_data.get('yoy_change', None),
+                    latest_data['monthly_change'],
+                    latest_data['yoy_change'],
                     forecast_change,
-                    latest_data.get('preferred_direction', 'down')
+                    latest_data['preferred_direction']
                 )
                 
                 if commentary:
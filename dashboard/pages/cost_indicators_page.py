@@ -8,10 +8,18 @@ from dashboard.utils.data_loader import load_all_indicators
 from dashboard.utils.data_processor import filter_time_period, download_link, format_metric_value
 from dashboard.components.indicator_card import create_indicator_card
 
-# Set up logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Logging is configured once by the app entry point
 logger = logging.getLogger(__name__)
 
+@st.cache_data(show_spinner=False)
+def cached_download_link(cache_key, _df, filename, link_text):
+    """Return the CSV download link for a table, reusing it across reruns.
+
+    ``cache_key`` must identify the table contents; ``_df`` is excluded from
+    Streamlit's argument hashing so the frame is only serialized on a miss.
+    """
+    return download_link(_df, filename, link_text)
+
 def show_cost_indicators_page():
     """Display cost indicators page."""
     # Load data
@@ -55,128 +63,123 @@ def show_cost_indicators_page():
         # Summary of year-over-year adjustments
         st.markdown('<h3 class="section-header">Year-Over-Year Adjustments (Cost Escalation)</h3>', unsafe_allow_html=True)
         
-        # Enhanced code for creating the yearly adjustments table with better logging
-        yearly_data = []
+        # Collect the yearly adjustments table column-wise; the rounded numeric
+        # adjustment is kept alongside the formatted string for coloring
+        indicator_names = []
+        adjustments = []
+        adjustment_values = []
+        effective_periods = []
         logger.info("Processing cost indicators for yearly adjustments table")
         
         for indicator_id, indicator_info in cost_indicators.items():
             df = indicator_info[0]
-            logger.info(f"Processing {indicator_id} with dataframe shape: {df.shape if df is not None else 'None'}")
             
-            if df is not None and not df.empty:
-                try:
-                    # Log columns available
-                    logger.info(f"{indicator_id} columns: {df.columns.tolist()}")
-                    
-                    # Check if yearly_adjustment column exists AND is not all NaN
-                    if 'yearly_adjustment' in df.columns:
-                        # Check for NaN values
-                        nan_count = pd.isna(df['yearly_adjustment']).sum()
-                        non_nan_count = len(df) - nan_count
-                        logger.info(f"{indicator_id} yearly_adjustment: {non_nan_count} non-NaN values, {nan_count} NaN values")
-                        
-                        if not pd.isna(df['yearly_adjustment']).all():
-                            # Get the latest non-NaN yearly adjustment value
-                            yearly_adj_series = df['yearly_adjustment'].dropna()
-                            if not yearly_adj_series.empty:
-                                yearly_adj = yearly_adj_series.iloc[-1]
-                                logger.info(f"{indicator_id} latest yearly_adjustment: {yearly_adj}")
-                                
-                                # Get indicator name and clean it
-                                indicator_name = df['source'].iloc[0] if 'source' in df.columns else indicator_id.replace('_', ' ').title()
-                                indicator_name = indicator_name.replace(" (Composite)", "").replace(" (SAMPLE DATA)", "").replace(" (Sample Data)", "")
-                                
-                                # Calculate effective period
-                                latest_date = df['Date'].iloc[-1]
-                                effective_start = pd.Timestamp(latest_date.year, 4, 1)  # April 1st of current year
-                                effective_end = pd.Timestamp(latest_date.year + 1, 3, 31)  # March 31st of next year
-                                
-                                # Use plain ASCII hyphen
-                                effective_date = f"{effective_start.strftime('%b %d, %Y')} - {effective_end.strftime('%b %d, %Y')}"
-                                
-                                # Format adjustment with explicit sign
-                                adj_formatted = f"{'+' if yearly_adj > 0 else ''}{yearly_adj:.2f}%"
-                                
-                                yearly_data.append({
-                                    "Indicator": indicator_name,
-                                    "Adjustment": adj_formatted, 
-                                    "Effective Period": effective_date
-                                })
-                                logger.info(f"Added {indicator_id} to yearly data table with adjustment {adj_formatted}")
-                            else:
-                                logger.warning(f"{indicator_id} has yearly_adjustment column but all values are NaN")
-                        else:
-                            logger.warning(f"{indicator_id} has yearly_adjustment column but all values are NaN")
-                    else:
-                        logger.warning(f"{indicator_id} does not have yearly_adjustment column")
-                except Exception as e:
-                    logger.error(f"Error processing yearly adjustment for {indicator_id}: {e}", exc_info=True)
+            # Skip indicators that cannot contribute a row before touching the data
+            if df is None or df.empty or 'yearly_adjustment' not in df.columns or 'Date' not in df.columns:
+                logger.warning(f"{indicator_id} does not have yearly_adjustment data")
+                continue
+            
+            # Get the latest non-NaN yearly adjustment value
+            yearly_adj_series = df['yearly_adjustment'].dropna()
+            if yearly_adj_series.empty:
+                logger.warning(f"{indicator_id} has yearly_adjustment column but all values are NaN")
+                continue
+            yearly_adj = yearly_adj_series.iloc[-1]
+            
+            # Get indicator name and clean it
+            indicator_name = df['source'].iloc[0] if 'source' in df.columns else indicator_id.replace('_', ' ').title()
+            indicator_name = indicator_name.replace(" (Composite)", "").replace(" (SAMPLE DATA)", "").replace(" (Sample Data)", "")
+            
+            # Calculate effective period
+            latest_date = df['Date'].iloc[-1]
+            effective_start = pd.Timestamp(latest_date.year, 4, 1)  # April 1st of current year
+            effective_end = pd.Timestamp(latest_date.year + 1, 3, 31)  # March 31st of next year
+            
+            # Use plain ASCII hyphen
+            effective_date = f"{effective_start.strftime('%b %d, %Y')} - {effective_end.strftime('%b %d, %Y')}"
+            
+            # Format adjustment with explicit sign
+            adj_formatted = f"{'+' if yearly_adj > 0 else ''}{yearly_adj:.2f}%"
+            
+            indicator_names.append(indicator_name)
+            adjustments.append(adj_formatted)
+            adjustment_values.append(round(float(yearly_adj), 2))
+            effective_periods.append(effective_date)
+            logger.info(f"Added {indicator_id} to yearly data table with adjustment {adj_formatted}")
         
-        if yearly_data:
-            yearly_df = pd.DataFrame(yearly_data)
+        if indicator_names:
+            yearly_df = pd.DataFrame({
+                "Indicator": indicator_names,
+                "Adjustment": adjustments,
+                "Effective Period": effective_periods
+            })
             
-            # Apply styling to the dataframe
-            if len(yearly_df) > 0:
-                # Create a cleaner table with better formatting
-                st.write("### Cost Adjustments Summary")
-                
-                # Use a plain HTML table for better control over formatting
-                html_table = "<table style='width:100%; border-collapse:collapse; margin-bottom:20px;'>"
-                html_table += "<thead><tr style='background-color:#f0f2f6;'>"
-                html_table += "<th style='padding:8px; text-align:left; border-bottom:2px solid #ddd;'>Indicator</th>"
-                html_table += "<th style='padding:8px; text-align:center; border-bottom:2px solid #ddd;'>Adjustment</th>"
-                html_table += "<th style='padding:8px; text-align:left; border-bottom:2px solid #ddd;'>Effective Period</th>"
-                html_table += "</tr></thead><tbody>"
-                
-                for _, row in yearly_df.iterrows():
-                    html_table += "<tr style='border-bottom:1px solid #ddd;'>"
-                    html_table += f"<td style='padding:8px; text-align:left;'>{row['Indicator']}</td>"
-                    
-                    # Color the adjustment based on value
-                    adj_value = float(row['Adjustment'].replace('+', '').replace('%', ''))
-                    if adj_value > 3.0:
-                        color = "#ce3e0d"  # Red for high adjustments
-                    elif adj_value < 0:
-                        color = "#00A651"  # Green for negative adjustments
-                    else:
-                        color = "#333333"  # Default text color
-                    
-                    html_table += f"<td style='padding:8px; text-align:center; font-weight:bold; color:{color};'>{row['Adjustment']}</td>"
-                    html_table += f"<td style='padding:8px; text-align:left;'>{row['Effective Period']}</td>"
-                    html_table += "</tr>"
-                
-                html_table += "</tbody></table>"
-                
-                # Display the HTML table
-                st.markdown(html_table, unsafe_allow_html=True)
-                
-                # Display the dataframe with explicitly controlled rendering
-                st.subheader("Cost Adjustments Data")
-                
-                # Use a simpler approach with st.table for more reliable rendering
-                styled_df = yearly_df.copy()
-                
-                # Force the dataframe to display even if it's being hidden by CSS
-                st.markdown("<div style='margin-top:20px; margin-bottom:20px;'>", unsafe_allow_html=True)
-                st.table(styled_df)
-                st.markdown("</div>", unsafe_allow_html=True)
-                
-                # Also keep the standard dataframe as a backup display method
-                st.markdown("<div style='margin-top:10px;'>", unsafe_allow_html=True)
-                st.dataframe(
-                    data=yearly_df,
-                    use_container_width=True,
-                    hide_index=True
-                )
-                st.markdown("</div>", unsafe_allow_html=True)
+            # Create a cleaner table with better formatting
+            st.write("### Cost Adjustments Summary")
+            
+            # Use a plain HTML table for better control over formatting; cell styles
+            # are emitted once in a scoped <style> block rather than on every cell
+            html_table = (
+                "<style>"
+                ".cost-adj-table{width:100%;border-collapse:collapse;margin-bottom:20px}"
+                ".cost-adj-table thead tr{background-color:#f0f2f6}"
+                ".cost-adj-table th{padding:8px;text-align:left;border-bottom:2px solid #ddd}"
+                ".cost-adj-table tbody tr{border-bottom:1px solid #ddd}"
+                ".cost-adj-table td{padding:8px;text-align:left}"
+                ".cost-adj-table .c{text-align:center}"
+                ".cost-adj-table td.c{font-weight:bold}"
+                "</style>"
+            )
+            html_table += "<table class='cost-adj-table'>"
+            html_table += "<thead><tr><th>Indicator</th><th class='c'>Adjustment</th><th>Effective Period</th></tr></thead><tbody>"
+            
+            for indicator_name, adj_formatted, adj_value, effective_date in zip(
+                    indicator_names, adjustments, adjustment_values, effective_periods):
+                # Color the adjustment based on value
+                if adj_value > 3.0:
+                    color = "#ce3e0d"  # Red for high adjustments
+                elif adj_value < 0:
+                    color = "#00A651"  # Green for negative adjustments
+                else:
+                    color = "#333333"  # Default text color
                 
-                # Add download link for adjustments
-                st.markdown(
-                    download_link(yearly_df, "cost_adjustments.csv", "Download Cost Adjustments Table"),
-                    unsafe_allow_html=True
-                )
-            else:
-                st.warning("No year-over-year adjustment data available")
+                html_table += f"<tr><td>{indicator_name}</td><td class='c' style='color:{color}'>{adj_formatted}</td><td>{effective_date}</td></tr>"
+            
+            html_table += "</tbody></table>"
+            
+            # Display the HTML table
+            st.markdown(html_table, unsafe_allow_html=True)
+            
+            # Display the dataframe with explicitly controlled rendering
+            st.subheader("Cost Adjustments Data")
+            
+            # Use a simpler approach with st.table for more reliable rendering
+            styled_df = yearly_df.copy()
+            
+            # Force the dataframe to display even if it's being hidden by CSS
+            st.markdown("<div style='margin-top:20px; margin-bottom:20px;'>", unsafe_allow_html=True)
+            st.table(styled_df)
+            st.markdown("</div>", unsafe_allow_html=True)
+            
+            # Also keep the standard dataframe as a backup display method
+            st.markdown("<div style='margin-top:10px;'>", unsafe_allow_html=True)
+            st.dataframe(
+                data=yearly_df,
+                use_container_width=True,
+                hide_index=True
+            )
+            st.markdown("</div>", unsafe_allow_html=True)
+            
+            # Add download link for adjustments
+            st.markdown(
+                cached_download_link(
+                    tuple(zip(indicator_names, adjustments, effective_periods)),
+                    yearly_df,
+                    "cost_adjustments.csv",
+                    "Download Cost Adjustments Table"
+                ),
+                unsafe_allow_html=True
+            )
         else:
             st.warning("No year-over-year adjustment data available")
         
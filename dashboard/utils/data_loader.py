@@ -1,55 +1,94 @@
 """Data loading utilities."""
 
 import os
+import csv
 import pandas as pd
 import numpy as np
 from datetime import datetime
 import logging
 import inspect
-import glob
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# pyarrow ships with Streamlit and gives a multithreaded CSV parser plus
+# Feather files for caching parsed frames; fall back to pandas' default C
+# parser and skip the on-disk cache when it is not installed
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    pa = None
+    feather = None
+    CSV_ENGINE = "c"
+
+def sample_rng(key):
+    """Return a generator seeded from a string key, stable across processes.
+
+    Sample data and forecasts are seeded from the indicator id so every run
+    produces the same series; crc32 is used because hash() is randomised
+    per process.
+    """
+    return np.random.default_rng(zlib.crc32(key.encode()))
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Set DASHBOARD_DEBUG_DATA=1 to log where the data directory is looked up
+DEBUG_DATA = os.environ.get('DASHBOARD_DEBUG_DATA', '') == '1'
+if DEBUG_DATA:
+    logger.setLevel(logging.DEBUG)
+
 # Enhanced debug logging to help identify file location issues
 def log_debug_info():
     """Print detailed debug info to help diagnose data access problems."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    
     # Print caller information
     caller_frame = inspect.currentframe().f_back
     caller_info = inspect.getframeinfo(caller_frame)
-    logger.info(f"Called from: {caller_info.filename}, line {caller_info.lineno}")
+    logger.debug(f"Called from: {caller_info.filename}, line {caller_info.lineno}")
     
     # Print current environment
-    logger.info(f"Current working directory: {os.getcwd()}")
+    logger.debug(f"Current working directory: {os.getcwd()}")
     cwd_contents = os.listdir('.')
-    logger.info(f"Current directory contents: {cwd_contents}")
+    logger.debug(f"Current directory contents: {cwd_contents}")
     
     # Check if data directory exists
     if 'data' in cwd_contents:
-        logger.info(f"Data directory found in current directory")
+        logger.debug(f"Data directory found in current directory")
         data_contents = os.listdir('data')
-        logger.info(f"Data directory contents: {data_contents}")
+        logger.debug(f"Data directory contents: {data_contents}")
         
         # Check subdirectories
         for subdir in ['raw', 'processed', 'forecasts']:
             subdir_path = os.path.join('data', subdir)
             if os.path.exists(subdir_path):
-                logger.info(f"Found {subdir} subdirectory")
-                logger.info(f"{subdir} contents: {os.listdir(subdir_path)}")
+                logger.debug(f"Found {subdir} subdirectory")
+                logger.debug(f"{subdir} contents: {os.listdir(subdir_path)}")
             else:
-                logger.warning(f"{subdir} subdirectory not found")
+                logger.debug(f"{subdir} subdirectory not found")
     else:
-        logger.warning("Data directory not found in current directory")
+        logger.debug("Data directory not found in current directory")
         
     # Additional environment info for Streamlit Cloud
     is_streamlit_cloud = os.environ.get('STREAMLIT_SHARING', '') == 'True'
-    logger.info(f"Running in Streamlit Cloud: {is_streamlit_cloud}")
+    logger.debug(f"Running in Streamlit Cloud: {is_streamlit_cloud}")
 
 # Get base data directory
+@lru_cache(maxsize=1)
 def get_data_dir():
-    """Get data directory with more robust path handling for Streamlit Cloud."""
-    log_debug_info()  # Log detailed debug info
+    """Get data directory with more robust path handling for Streamlit Cloud.
+
+    The lookup (and its debug logging) runs once per process; later calls
+    return the resolved path.
+    """
+    if DEBUG_DATA:
+        log_debug_info()
     
     # For Streamlit Cloud - prioritize repo root 'data' directory 
     if os.path.exists("data"):
@@ -99,16 +138,17 @@ def verify_data_availability():
     files_found = False
     
     for dir_name, dir_path in directories.items():
-        if os.path.exists(dir_path):
-            files = os.listdir(dir_path)
+        # The cached listing is empty for a missing directory, so only an
+        # empty result needs a separate existence check; parsed-frame cache
+        # sidecars are not data files
+        files = [name for name in list_data_dir(dir_path) if '.cache.' not in name]
+        if files:
             logger.info(f"Found {len(files)} files in {dir_name} directory")
-            if len(files) > 0:
-                logger.info(f"Sample files: {', '.join(files[:5])}")
-                files_found = True
-            if not files:
-                logger.warning(f"No files found in {dir_name} directory")
-                # Make directory if it doesn't exist
-                os.makedirs(dir_path, exist_ok=True)
+            logger.info(f"Sample files: {', '.join(files[:5])}")
+            files_found = True
+        elif os.path.isdir(dir_path):
+            logger.info(f"Found 0 files in {dir_name} directory")
+            logger.warning(f"No files found in {dir_name} directory")
         else:
             logger.error(f"Directory not found: {dir_path}")
             os.makedirs(dir_path, exist_ok=True)
@@ -126,24 +166,219 @@ FORECASTS_DIR = os.path.join(BASE_DATA_DIR, "forecasts")
 for directory in [RAW_DIR, PROCESSED_DIR, FORECASTS_DIR]:
     os.makedirs(directory, exist_ok=True)
 
-def find_files_recursive(base_dir, pattern):
-    """Find files matching pattern recursively in the base directory."""
-    matches = []
+# Directory listings keyed by path, stored with the directory's mtime so added
+# or removed files invalidate the listing
+_DIR_INDEX_CACHE = {}
+
+def list_data_dir(directory):
+    """Return {filename: path} for the files in a directory using a single scandir."""
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        return {}
     
-    # First look in the exact directory
-    direct_matches = glob.glob(os.path.join(base_dir, pattern))
-    if direct_matches:
-        matches.extend(direct_matches)
-        
-    # Then search recursively 1 level down
-    for subdir in os.listdir(base_dir):
-        subdir_path = os.path.join(base_dir, subdir)
-        if os.path.isdir(subdir_path):
-            subdir_matches = glob.glob(os.path.join(subdir_path, pattern))
-            if subdir_matches:
-                matches.extend(subdir_matches)
+    cached = _DIR_INDEX_CACHE.get(directory)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    try:
+        with os.scandir(directory) as entries:
+            index = {entry.name: entry.path for entry in entries if entry.is_file()}
+    except OSError as e:
+        logger.error(f"Error listing directory {directory}: {e}")
+        return {}
+    
+    _DIR_INDEX_CACHE[directory] = (mtime, index)
+    return index
+
+def data_file_exists(file_path):
+    """Check whether a file exists using the cached listing of its directory."""
+    return os.path.basename(file_path) in list_data_dir(os.path.dirname(file_path))
+
+def find_files_recursive(base_dir, indicator_id, keyword=None):
+    """Find CSV files naming an indicator in the base directory and one level below it.
+
+    Names are matched case-insensitively; files whose name starts with the
+    indicator id are listed first. When ``keyword`` is given the name must
+    contain it too.
+    """
+    directories = [base_dir]
+    try:
+        with os.scandir(base_dir) as entries:
+            directories.extend(entry.path for entry in entries if entry.is_dir())
+    except OSError as e:
+        logger.error(f"Error listing directory {base_dir}: {e}")
+        return []
+    
+    indicator_id = indicator_id.lower()
+    prefixed, other = [], []
+    for directory in directories:
+        for name, path in list_data_dir(directory).items():
+            name_l = name.lower()
+            if (name.startswith('.') or not name_l.endswith('.csv')
+                    or indicator_id not in name_l
+                    or (keyword is not None and keyword not in name_l)):
+                continue
+            (prefixed if name_l.startswith(indicator_id) else other).append(path)
+    
+    return prefixed + other
+
+# Parsed CSV frames keyed by path, stored with the file's (mtime, size) so an
+# unchanged file is never parsed twice in the same process
+_CSV_CACHE = {}
+
+def _read_feather_cache(cache_path, signature):
+    """Return the frame stored in a Feather cache file if it matches the CSV signature."""
+    if feather is None or not data_file_exists(cache_path):
+        return None
+    
+    try:
+        table = feather.read_table(cache_path, memory_map=True)
+        metadata = table.schema.metadata or {}
+        if metadata.get(b'source_signature') != str(signature).encode():
+            return None
+        return table.to_pandas()
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache file {cache_path}: {e}")
+        return None
+
+def _write_feather_cache(cache_path, signature, df):
+    """Store a parsed frame next to its CSV so later processes can skip parsing."""
+    if feather is None:
+        return
+    
+    # Write to a temporary file and move it into place so concurrent loads
+    # never memory-map a half-written cache
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[b'source_signature'] = str(signature).encode()
+        feather.write_feather(table.replace_schema_metadata(metadata), tmp_path)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning(f"Could not write cache file {cache_path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def read_csv_cached(file_path):
+    """Read a CSV file, reusing the parsed frame while the file is unchanged.
+
+    Parsed frames are kept in memory and, when pyarrow is available, in a
+    ``<file>.cache.feather`` file that is memory-mapped on the next cold start.
+    A copy is returned so callers can add or filter columns without touching
+    the cached frame.
+    """
+    stat = os.stat(file_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    
+    cached = _CSV_CACHE.get(file_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1].copy()
+    
+    cache_path = f"{file_path}.cache.feather"
+    df = _read_feather_cache(cache_path, signature)
+    if df is None:
+        # Declare the known column types up front so the parser skips
+        # inference; each fallback drops the part that failed
+        with open(file_path, newline='', encoding='utf-8-sig', errors='replace') as f:
+            header = next(csv.reader(f), [])
+        parse_dates = [column for column in DATE_COLUMNS if column in header]
+        attempts = (
+            {'engine': CSV_ENGINE, 'dtype': CSV_DTYPES, 'parse_dates': parse_dates},
+            {'dtype': CSV_DTYPES, 'parse_dates': parse_dates},  # Files the pyarrow parser rejects
+            {},  # Values that do not fit the declared types
+        )
+        for attempt, options in enumerate(attempts, start=1):
+            try:
+                df = pd.read_csv(file_path, **options)
+                break
+            except ValueError:
+                if attempt == len(attempts):
+                    raise
+        _write_feather_cache(cache_path, signature, df)
     
-    return matches
+    _CSV_CACHE[file_path] = (signature, df)
+    return df.copy()
+
+# Name fragments that mark a numeric column as a date part rather than a value
+DATE_TOKENS = frozenset(('date', 'time', 'year', 'month', 'day'))
+
+def find_value_column(df):
+    """Return the first numeric column that is not date-like, or None."""
+    for column in df.select_dtypes(include=['number']).columns:
+        name = str(column).lower()
+        if not any(token in name for token in DATE_TOKENS):
+            return column
+    return None
+
+def parse_date_column(df):
+    """Convert Date to datetime in place unless the reader already parsed it."""
+    if not pd.api.types.is_datetime64_any_dtype(df['Date']):
+        df['Date'] = pd.to_datetime(df['Date'])
+
+def sort_by_date(df):
+    """Return the frame ordered by Date so the last row is the latest observation.
+
+    Unparseable dates sort first; already-ordered frames are returned as is.
+    """
+    if df['Date'].is_monotonic_increasing:
+        return df
+    return df.sort_values('Date', kind='stable', na_position='first', ignore_index=True)
+
+def percent_change(values, periods):
+    """Return the percentage change over ``periods`` steps of a numpy array, NaN-padded.
+
+    Computed in float32, in place in the output buffer.
+    """
+    values = np.asarray(values, dtype=np.float32)
+    changes = np.full(len(values), np.nan, dtype=np.float32)
+    if len(values) > periods:
+        shifted = changes[periods:]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(values[periods:], values[:-periods], out=shifted)
+        shifted -= 1
+        shifted *= 100
+    return changes
+
+def missing_change_columns(df):
+    """Return the monthly and year-over-year change columns the frame lacks."""
+    if 'value' not in df.columns:
+        return {}
+    
+    values = df['value'].to_numpy(dtype=np.float32)
+    changes = {}
+    if 'monthly_change' not in df.columns and len(df) > 1:
+        changes['monthly_change'] = percent_change(values, 1)
+    if 'yoy_change' not in df.columns and len(df) >= 12:
+        changes['yoy_change'] = percent_change(values, 12)
+    return changes
+
+def missing_metadata_columns(df, indicator_id, latest_date):
+    """Return the default metadata columns the frame lacks.
+
+    ``latest_date`` is the frame's most recent Date, already computed by the caller.
+    """
+    defaults = {
+        'source': get_default_source_name(indicator_id),
+        'unit': get_default_unit(indicator_id),
+        'preferred_direction': get_default_preferred_direction(indicator_id),
+        'description': get_default_description(indicator_id),
+    }
+    missing = {column: value for column, value in defaults.items() if column not in df.columns}
+    if 'last_updated_date' not in df.columns:
+        missing['last_updated_date'] = latest_date.strftime("%b-%y")
+    return missing
+
+def add_missing_columns(df, indicator_id, latest_date):
+    """Add any missing change and metadata columns in a single assign."""
+    missing = missing_change_columns(df)
+    missing.update(missing_metadata_columns(df, indicator_id, latest_date))
+    if missing:
+        df = df.assign(**missing)
+    return df
 
 def load_indicator_data(indicator_id):
     """Load indicator data from files or generate sample data if not available."""
@@ -155,10 +390,10 @@ def load_indicator_data(indicator_id):
     # Special handling for CRUspi to prioritize direct data
     if indicator_id == 'cruspi':
         direct_file_path = os.path.join(RAW_DIR, "cruspi_direct.csv")
-        if os.path.exists(direct_file_path):
+        if data_file_exists(direct_file_path):
             try:
                 logger.info(f"Loading CRUspi data from direct file: {direct_file_path}")
-                df = pd.read_csv(direct_file_path)
+                df = read_csv_cached(direct_file_path)
                 
                 if not df.empty:
                     # Process the CRUspi direct data
@@ -171,35 +406,23 @@ def load_indicator_data(indicator_id):
                     # Find the main value column if 'value' doesn't exist
                     if 'value' not in df.columns:
                         # Look for numerical columns that could be values
-                        value_cols = [col for col in df.select_dtypes(include=['number']).columns 
-                                    if not any(x in col.lower() for x in ['date', 'time', 'year', 'month', 'day'])]
-                        if value_cols:
-                            df['value'] = df[value_cols[0]]
-                            logger.info(f"Using {value_cols[0]} as value column for CRUspi")
+                        value_col = find_value_column(df)
+                        if value_col is not None:
+                            df['value'] = df[value_col]
+                            logger.info(f"Using {value_col} as value column for CRUspi")
                     
                     # Continue with standard processing
-                    df['Date'] = pd.to_datetime(df['Date'])
+                    parse_date_column(df)
+                    df = sort_by_date(df)
+                    latest_date = df['Date'].iat[-1]
                     
                     # Add missing columns if needed
-                    if 'monthly_change' not in df.columns and 'value' in df.columns and len(df) > 1:
-                        df['monthly_change'] = df['value'].pct_change() * 100
-                    if 'yoy_change' not in df.columns and 'value' in df.columns and len(df) >= 12:
-                        df['yoy_change'] = df['value'].pct_change(12) * 100
-                    if 'source' not in df.columns:
-                        df['source'] = "CRU Steel Price Index" # Direct, non-sample source
-                    if 'unit' not in df.columns:
-                        df['unit'] = get_default_unit(indicator_id)
-                    if 'preferred_direction' not in df.columns:
-                        df['preferred_direction'] = get_default_preferred_direction(indicator_id)
-                    if 'description' not in df.columns:
-                        df['description'] = get_default_description(indicator_id)
-                    if 'last_updated_date' not in df.columns:
-                        df['last_updated_date'] = df['Date'].max().strftime("%b-%y")
+                    df = add_missing_columns(df, indicator_id, latest_date)
                     
                     # Explicitly mark as NOT sample data
                     using_sample_data = False
                     data_source = f"Data from direct file: {os.path.basename(direct_file_path)}"
-                    logger.info(f"Successfully loaded CRUspi data with latest date: {df['Date'].max()}")
+                    logger.info(f"Successfully loaded CRUspi data with latest date: {latest_date}")
                     
                     return df, data_source, using_sample_data
             except Exception as e:
@@ -218,16 +441,14 @@ def load_indicator_data(indicator_id):
     # Log all possible paths we're checking
     logger.info(f"Checking for {indicator_id} data in the following paths:")
     for file_path in possible_files:
-        logger.info(f"  - {file_path} (exists: {os.path.exists(file_path)})")
+        logger.info(f"  - {file_path} (exists: {data_file_exists(file_path)})")
 
     # Try to locate files more aggressively using recursive search
-    if not any(os.path.exists(file_path) for file_path in possible_files):
+    if not any(data_file_exists(file_path) for file_path in possible_files):
         logger.info(f"No exact file matches found, trying recursive search")
         
         # Look for any CSV file with indicator_id in the name
-        recursive_matches = []
-        for pattern in [f"{indicator_id}*.csv", f"*{indicator_id}*.csv"]:
-            recursive_matches.extend(find_files_recursive(BASE_DATA_DIR, pattern))
+        recursive_matches = find_files_recursive(BASE_DATA_DIR, indicator_id)
         
         if recursive_matches:
             logger.info(f"Found {len(recursive_matches)} potential matches through recursive search")
@@ -239,10 +460,10 @@ def load_indicator_data(indicator_id):
     
     # Try each possible file path
     for file_path in possible_files:
-        if os.path.exists(file_path):
+        if data_file_exists(file_path):
             try:
                 logger.info(f"Loading data from: {file_path}")
-                df = pd.read_csv(file_path)
+                df = read_csv_cached(file_path)
                 
                 # Check if DataFrame is empty
                 if df.empty:
@@ -261,51 +482,37 @@ def load_indicator_data(indicator_id):
                     
                     if 'value' not in df.columns:
                         # Try to find value-like column
-                        numeric_cols = df.select_dtypes(include=['number']).columns
-                        if len(numeric_cols) > 0:
-                            # Exclude date-like columns from numeric columns
-                            value_cols = [col for col in numeric_cols if not any(x in col.lower() for x in ['date', 'time', 'year', 'month', 'day'])]
-                            if value_cols:
-                                logger.info(f"Using {value_cols[0]} as value column")
-                                df['value'] = df[value_cols[0]]
+                        value_col = find_value_column(df)
+                        if value_col is not None:
+                            logger.info(f"Using {value_col} as value column")
+                            df['value'] = df[value_col]
                 
                 if 'Date' not in df.columns or 'value' not in df.columns:
                     logger.warning(f"Could not resolve missing required columns in {file_path}")
                     continue
                 
                 # Process the data
-                df['Date'] = pd.to_datetime(df['Date'])
+                parse_date_column(df)
+                df = sort_by_date(df)
                 
                 # Ensure no future dates in the data
                 current_date = datetime.now()
-                if df['Date'].max() > current_date:
+                latest_date = df['Date'].iat[-1]
+                if latest_date > current_date:
                     logger.warning(f"File {file_path} contains future dates. These will be filtered out.")
                     df = df[df['Date'] <= current_date]
+                    latest_date = df['Date'].iat[-1]
                 
                 # Add missing columns if needed
-                if 'monthly_change' not in df.columns and 'value' in df.columns and len(df) > 1:
-                    df['monthly_change'] = df['value'].pct_change() * 100
-                if 'yoy_change' not in df.columns and 'value' in df.columns and len(df) >= 12:
-                    df['yoy_change'] = df['value'].pct_change(12) * 100
-                if 'source' not in df.columns:
-                    df['source'] = get_default_source_name(indicator_id)
-                if 'unit' not in df.columns:
-                    df['unit'] = get_default_unit(indicator_id)
-                if 'preferred_direction' not in df.columns:
-                    df['preferred_direction'] = get_default_preferred_direction(indicator_id)
-                if 'description' not in df.columns:
-                    df['description'] = get_default_description(indicator_id)
-                if 'last_updated_date' not in df.columns:
-                    df['last_updated_date'] = df['Date'].max().strftime("%b-%y")
+                df = add_missing_columns(df, indicator_id, latest_date)
                 
                 # Check if sample data
-                using_sample_data = 'sample' in file_path.lower() or 'SAMPLE' in file_path
-                if 'source' in df.columns:
-                    if any(df['source'].str.contains('sample', case=False)) or any(df['source'].str.contains('SAMPLE')):
-                        using_sample_data = True
+                using_sample_data = 'sample' in file_path.lower()
+                if source_is_sample(df):
+                    using_sample_data = True
                 
                 data_source = f"Data from file: {os.path.basename(file_path)}"
-                logger.info(f"Successfully loaded {indicator_id} data with latest date: {df['Date'].max()}")
+                logger.info(f"Successfully loaded {indicator_id} data with latest date: {latest_date}")
                 return df, data_source, using_sample_data
             except Exception as e:
                 logger.error(f"Error reading file {file_path} for {indicator_id}: {e}")
@@ -317,6 +524,16 @@ def load_indicator_data(indicator_id):
     data_source = f"Sample data ({get_default_source_name(indicator_id)})"
     return df, data_source, using_sample_data
 
+def source_is_sample(df):
+    """Check a frame's source label for a sample-data marker.
+
+    The source is uniform within a file, so only the first row is checked.
+    """
+    if df.empty or 'source' not in df.columns:
+        return False
+    source = df['source'].iat[0]
+    return isinstance(source, str) and 'sample' in source.lower()
+
 def is_sample_data(indicator_info):
     """Determine more accurately if the data is sample data."""
     if isinstance(indicator_info, tuple) and len(indicator_info) >= 3:
@@ -326,22 +543,20 @@ def is_sample_data(indicator_info):
         
         # If indicator_id is cruspi and we're using the direct file
         data_df = indicator_info[0]
-        source = indicator_info[1]
+        source = indicator_info[1].lower()
         
         # Special case for cruspi with direct file
         if 'indicator_id' in data_df.columns and data_df['indicator_id'].iloc[0] == 'cruspi':
-            if 'direct' in source.lower():
+            if 'direct' in source:
                 # We know it's from the direct file, not sample
                 return False
         
         # Check data source string for sample indicators
-        if 'sample' in source.lower() or 'SAMPLE' in source:
+        if 'sample' in source:
             return True
         
-        if not data_df.empty and 'source' in data_df.columns:
-            source_col = data_df['source'].iloc[0] 
-            if 'sample' in source_col.lower() or 'SAMPLE' in source_col:
-                return True
+        if source_is_sample(data_df):
+            return True
     
     return False
 
@@ -364,8 +579,12 @@ def get_valid_update_date(date_value):
         logger.error(f"Error formatting date: {e}")
         return "Unknown"
 
-def load_forecast_data(indicator_id):
-    """Load forecast data from files or generate sample data if not available."""
+def load_forecast_data(indicator_id, indicator_df=None):
+    """Load forecast data from files or generate sample data if not available.
+
+    ``indicator_df`` is the already-loaded indicator data, used when a forecast
+    has to be generated; it is loaded from disk when not supplied.
+    """
     logger.info(f"Loading forecast data for indicator: {indicator_id}")
     
     data_source = ""
@@ -381,16 +600,14 @@ def load_forecast_data(indicator_id):
     # Enhanced logging
     logger.info(f"Checking for {indicator_id} forecast in the following paths:")
     for file_path in possible_files:
-        logger.info(f"  - {file_path} (exists: {os.path.exists(file_path)})")
+        logger.info(f"  - {file_path} (exists: {data_file_exists(file_path)})")
     
     # Try to locate files more aggressively using recursive search
-    if not any(os.path.exists(file_path) for file_path in possible_files):
+    if not any(data_file_exists(file_path) for file_path in possible_files):
         logger.info(f"No exact forecast file matches found, trying recursive search")
         
         # Look for any CSV file with indicator_id and forecast in the name
-        recursive_matches = []
-        for pattern in [f"{indicator_id}*forecast*.csv", f"*forecast*{indicator_id}*.csv"]:
-            recursive_matches.extend(find_files_recursive(BASE_DATA_DIR, pattern))
+        recursive_matches = find_files_recursive(BASE_DATA_DIR, indicator_id, keyword='forecast')
         
         if recursive_matches:
             logger.info(f"Found {len(recursive_matches)} potential forecast matches through recursive search")
@@ -401,10 +618,10 @@ def load_forecast_data(indicator_id):
             possible_files.extend(recursive_matches)
     
     for file_path in possible_files:
-        if os.path.exists(file_path):
+        if data_file_exists(file_path):
             try:
                 logger.info(f"Loading forecast data from: {file_path}")
-                df = pd.read_csv(file_path)
+                df = read_csv_cached(file_path)
                 
                 # Check if DataFrame is empty
                 if df.empty:
@@ -416,11 +633,14 @@ def load_forecast_data(indicator_id):
                     logger.warning(f"Forecast file {file_path} is missing required columns")
                     continue
                 
-                df['Date'] = pd.to_datetime(df['Date'])
+                parse_date_column(df)
+                df = sort_by_date(df)
                 
-                # Filter to keep only forecasts for current month and future
+                # Filter to keep only forecasts for current month and future;
+                # the frame is sorted, so skip the copy when the first row qualifies
                 current_month = datetime.now().replace(day=1)
-                df = df[df['Date'] >= current_month]
+                if not df['Date'].iat[0] >= current_month:
+                    df = df[df['Date'] >= current_month]
                 
                 # Skip if filtered dataframe is empty (no future forecasts)
                 if df.empty:
@@ -438,10 +658,9 @@ def load_forecast_data(indicator_id):
                     df['unit'] = '$'
                 
                 # Check if sample data
-                using_sample_data = 'sample' in file_path.lower() or any(word in file_path for word in ['SAMPLE', 'Sample'])
-                if 'source' in df.columns:
-                    if any(df['source'].str.contains('sample', case=False)) or any(df['source'].str.contains('SAMPLE')):
-                        using_sample_data = True
+                using_sample_data = 'sample' in file_path.lower()
+                if source_is_sample(df):
+                    using_sample_data = True
                     
                 data_source = f"Forecast from file: {os.path.basename(file_path)}"
                 return df, data_source, using_sample_data
@@ -450,7 +669,7 @@ def load_forecast_data(indicator_id):
     
     # Try to get actual indicator data to generate more accurate forecasts
     try:
-        indicator_data = load_indicator_data(indicator_id)[0]
+        indicator_data = indicator_df if indicator_df is not None else load_indicator_data(indicator_id)[0]
         if not indicator_data.empty:
             logger.warning(f"No forecast file found for {indicator_id}. Generating sample forecast based on actual data.")
             using_sample_data = True
@@ -492,44 +711,134 @@ def generate_sample_forecast_from_actual(indicator_id, actual_data):
             elif avg_monthly_pct_change < -0.05:  # Cap at -5% monthly decline
                 avg_monthly_pct_change = -0.05
             
-            # Use this to project future values
-            values = []
-            for i in range(num_periods):
-                if i == 0:
-                    # First forecast value should be very close to last actual
-                    # Smaller random component to ensure continuity
-                    new_value = last_value * (1 + avg_monthly_pct_change + np.random.normal(0, 0.0005))
-                else:
-                    # Subsequent values follow the trend with gradually increasing randomness
-                    new_value = values[-1] * (1 + avg_monthly_pct_change + np.random.normal(0, 0.001 * i))
-                values.append(new_value)
+            # Use this to project future values. The first forecast value should
+            # be very close to the last actual, so it gets a smaller random
+            # component; later values get gradually increasing randomness
+            steps = np.arange(num_periods, dtype=np.float32)
+            noise_scale = 0.001 * steps
+            noise_scale[0] = 0.0005
+            growth = 1 + avg_monthly_pct_change + sample_rng(f"{indicator_id}_forecast").normal(0, noise_scale)
+            values = (last_value * np.cumprod(growth)).astype(np.float32)
             
             # Generate confidence intervals that widen with time
             # Start with narrower intervals to ensure continuity
-            lower_ci = [val * (1 - 0.005 - 0.005*i) for i, val in enumerate(values)]
-            upper_ci = [val * (1 + 0.005 + 0.005*i) for i, val in enumerate(values)]
+            lower_ci = values * (1 - 0.005 - 0.005 * steps)
+            upper_ci = values * (1 + 0.005 + 0.005 * steps)
             
-            df = pd.DataFrame({
+            columns = {
                 'Date': forecast_dates,
                 'value': values,
                 'lower_ci': lower_ci,
                 'upper_ci': upper_ci,
                 'source': f"{get_default_source_name(indicator_id)} - FORECAST",
-                'indicator_id': [indicator_id] * num_periods,
-                'preferred_direction': [get_default_preferred_direction(indicator_id)] * num_periods
-            })
+                'indicator_id': indicator_id,
+                'preferred_direction': get_default_preferred_direction(indicator_id)
+            }
             
             # Add unit for specific indicators
             if indicator_id == 'wti_oil':
-                df['unit'] = '$'
+                columns['unit'] = '$'
             
-            return df
+            return pd.DataFrame(columns)
     
     # If we couldn't generate from actual data, fall back to standard sample
     return generate_sample_forecast(indicator_id)
 
+# Per-row metadata repeats one value down the whole frame, and the measurements
+# do not need double precision for display
+CATEGORY_COLUMNS = ('source', 'unit', 'preferred_direction', 'description', 'indicator_id')
+FLOAT32_COLUMNS = ('value', 'monthly_change', 'yoy_change', 'yearly_adjustment', 'lower_ci', 'upper_ci')
+
+# Column types declared when parsing data files; columns a file lacks are ignored
+CSV_DTYPES = {**{column: 'float32' for column in FLOAT32_COLUMNS},
+              **{column: 'category' for column in CATEGORY_COLUMNS}}
+DATE_COLUMNS = ['Date']
+
+def compact_dtypes(df):
+    """Store metadata columns as categories and measurement columns as float32."""
+    conversions = {column: 'category' for column in CATEGORY_COLUMNS
+                   if column in df.columns and pd.api.types.is_string_dtype(df[column])}
+    conversions.update({column: 'float32' for column in FLOAT32_COLUMNS
+                        if column in df.columns and pd.api.types.is_float_dtype(df[column])})
+    
+    if conversions:
+        df = df.astype(conversions)
+    return df
+
+def load_indicator_with_forecast(indicator_id):
+    """Load an indicator and, when it has data, its forecast.
+
+    Returns ``(indicator_info, forecast_info)``; ``forecast_info`` is None when
+    the indicator is empty or its forecast could not be loaded.
+    """
+    indicator_info = load_indicator_data(indicator_id)
+    df = indicator_info[0]
+    if df.empty:
+        return indicator_info, None
+    
+    try:
+        # Pass the loaded data along so a generated forecast does not re-read it
+        return indicator_info, load_forecast_data(indicator_id, df)
+    except Exception as e:
+        logger.error(f"Error loading forecast for {indicator_id}: {e}")
+        return indicator_info, None
+
+# Columns of an indicator's latest row that feed its summary entry, with the
+# value used when a frame does not have the column
+SUMMARY_DEFAULTS = {
+    'Date': None,
+    'value': 0,
+    'monthly_change': 0,
+    'yoy_change': 0,
+    'source': '',
+    'unit': '',
+    'preferred_direction': 'neutral',
+    'description': '',
+    'yearly_adjustment': None,
+}
+
+# Last load_all_indicators result, stored with the data signature it was built from
+_ALL_INDICATORS_CACHE = {}
+
+def get_data_signature():
+    """Return a key that changes whenever a data CSV changes or the day rolls over.
+
+    Forecast filtering and update dates depend on the current date, so the
+    date is part of the key alongside each file's path, mtime and size.
+    """
+    files = []
+    for root, _, filenames in os.walk(BASE_DATA_DIR):
+        for filename in filenames:
+            if filename.endswith('.csv'):
+                path = os.path.join(root, filename)
+                stat = os.stat(path)
+                files.append((path, stat.st_mtime_ns, stat.st_size))
+    
+    return (datetime.now().strftime('%Y-%m-%d'), tuple(sorted(files)))
+
 def load_all_indicators():
-    """Load all economic indicators and their forecasts."""
+    """Load all economic indicators and their forecasts.
+
+    The result is reused until a data file changes, so pages that call this
+    on every rerun only pay for a directory walk.
+    """
+    try:
+        signature = get_data_signature()
+    except OSError as e:
+        logger.error(f"Error reading data directory signature: {e}")
+        signature = None
+    
+    cached = _ALL_INDICATORS_CACHE.get('latest')
+    if signature is not None and cached is not None and cached[0] == signature:
+        return cached[1]
+    
+    result = _load_all_indicators()
+    if signature is not None:
+        _ALL_INDICATORS_CACHE['latest'] = (signature, result)
+    return result
+
+def _load_all_indicators():
+    """Load all indicators, forecasts, summaries and the correlation matrix from disk."""
     # Verify data is available
     verify_data_availability()
     
@@ -559,79 +868,83 @@ def load_all_indicators():
         'explosives'
     ]
     
+    # Each indicator and its forecast load independently of the others, so
+    # run them concurrently; results are collected in list order below
+    with ThreadPoolExecutor(max_workers=min(8, len(indicators))) as executor:
+        futures = {indicator_id: executor.submit(load_indicator_with_forecast, indicator_id) for indicator_id in indicators}
+    
     # Load each indicator
-    for indicator_id in indicators:
+    for indicator_id, future in futures.items():
         try:
-            df_info = load_indicator_data(indicator_id)
-            df = df_info[0]
-            data_source = df_info[1]
-            using_sample_data = df_info[2]
+            (df, data_source, using_sample_data), forecast_info = future.result()
             
             if not df.empty:
-                all_indicators[indicator_id] = (df, data_source, using_sample_data)
+                all_indicators[indicator_id] = (compact_dtypes(df), data_source, using_sample_data)
                 
                 # Load forecast data
-                forecast_info = load_forecast_data(indicator_id)
-                forecast_df = forecast_info[0]
-                forecast_source = forecast_info[1]
-                forecast_using_sample = forecast_info[2]
-                
-                if not forecast_df.empty:
-                    forecasts[indicator_id] = (forecast_df, forecast_source, forecast_using_sample)
+                if forecast_info is not None and not forecast_info[0].empty:
+                    forecast_df, forecast_source, forecast_using_sample = forecast_info
+                    forecasts[indicator_id] = (compact_dtypes(forecast_df), forecast_source, forecast_using_sample)
         except Exception as e:
             logger.error(f"Error loading indicator {indicator_id}: {e}")
     
-    # Generate summary data
+    # Gather every indicator's latest row into one frame so the summary is
+    # built from a single pass over tuples
+    latest_rows = []
     for indicator_id, df_info in all_indicators.items():
+        df = df_info[0]
+        missing = {column: default for column, default in SUMMARY_DEFAULTS.items() if column not in df.columns}
+        latest_rows.append(
+            df.tail(1).reindex(columns=list(SUMMARY_DEFAULTS)).assign(indicator_id=indicator_id, **missing)
+        )
+    latest_rows = pd.concat(latest_rows, ignore_index=True) if latest_rows else pd.DataFrame(columns=list(SUMMARY_DEFAULTS) + ['indicator_id'])
+    
+    # Generate summary data
+    for latest_data in latest_rows.itertuples(index=False):
+        indicator_id = latest_data.indicator_id
         try:
-            df = df_info[0]
-            data_source = df_info[1]
-            using_sample_data = df_info[2]
+            df, data_source, using_sample_data = all_indicators[indicator_id]
+            is_cruspi_direct = indicator_id == 'cruspi' and 'direct' in data_source.lower()
             
-            # Special handling for CRUspi direct data
-            if indicator_id == 'cruspi' and 'direct' in data_source.lower():
+            # Special handling for CRUspi direct data; otherwise trust the
+            # loader's flag, which already checked the source column
+            if is_cruspi_direct:
                 using_sample_data = False
-            # Additional check for sample data
-            elif 'source' in df.columns:
-                if any(df['source'].str.contains('sample', case=False)) or any(df['source'].str.contains('SAMPLE')):
-                    using_sample_data = True
             
-            if not df.empty:
-                latest_data = df.iloc[-1].to_dict()
-                forecast_info = forecasts.get(indicator_id, (pd.DataFrame(), "", False))
-                forecast_df = forecast_info[0]
-                
-                # Determine trend
-                trend_text, trend_class, trend_desc = determine_trend(df, forecast_df)
-                
-                # Ensure last_updated date is not in the future
-                last_updated = pd.to_datetime(latest_data.get('Date'))
-                if last_updated > datetime.now():
-                    last_updated = datetime.now()
-                
-                # Override source name for CRUspi direct data to ensure we don't display "sample"
-                source_name = latest_data.get('source', '')
-                if indicator_id == 'cruspi' and 'direct' in data_source.lower():
-                    source_name = "CRU Steel Price Index"
-                
-                summary_data[indicator_id] = {
-                    'indicator_id': indicator_id,
-                    'name': source_name,
-                    'current_value': latest_data.get('value', 0),
-                    'monthly_change': latest_data.get('monthly_change', 0),
-                    'yoy_change': latest_data.get('yoy_change', 0),
-                    'unit': latest_data.get('unit', ''),
-                    'preferred_direction': latest_data.get('preferred_direction', 'neutral'),
-                    'description': latest_data.get('description', ''),
-                    'trend_text': trend_text,
-                    'trend_class': trend_class,
-                    'trend_description': trend_desc,
-                    'last_updated': last_updated.strftime('%b %Y'),
-                    'data_source': data_source,
-                    'using_sample_data': using_sample_data,
-                    # Add yearly_adjustment if available for cost indicators
-                    'yearly_adjustment': latest_data.get('yearly_adjustment', None)
-                }
+            forecast_info = forecasts.get(indicator_id, (pd.DataFrame(), "", False))
+            forecast_df = forecast_info[0]
+            
+            # Determine trend
+            trend_text, trend_class, trend_desc = determine_trend(df, forecast_df)
+            
+            # Ensure last_updated date is not in the future
+            last_updated = latest_data.Date
+            if last_updated > datetime.now():
+                last_updated = datetime.now()
+            
+            # Override source name for CRUspi direct data to ensure we don't display "sample"
+            source_name = latest_data.source
+            if is_cruspi_direct:
+                source_name = "CRU Steel Price Index"
+            
+            summary_data[indicator_id] = {
+                'indicator_id': indicator_id,
+                'name': source_name,
+                'current_value': latest_data.value,
+                'monthly_change': latest_data.monthly_change,
+                'yoy_change': latest_data.yoy_change,
+                'unit': latest_data.unit,
+                'preferred_direction': latest_data.preferred_direction,
+                'description': latest_data.description,
+                'trend_text': trend_text,
+                'trend_class': trend_class,
+                'trend_description': trend_desc,
+                'last_updated': last_updated.strftime('%b %Y'),
+                'data_source': data_source,
+                'using_sample_data': using_sample_data,
+                # Add yearly_adjustment if available for cost indicators
+                'yearly_adjustment': latest_data.yearly_adjustment
+            }
         except Exception as e:
             logger.error(f"Error generating summary for {indicator_id}: {e}")
     
@@ -650,17 +963,21 @@ def determine_trend(df, forecast_df=None):
     trend_desc = "Prices have been relatively stable."
     
     if len(df) >= 2:
-        recent_values = df['value'].tail(min(6, len(df)))
+        recent_values = df['value'].to_numpy(dtype=float)[-6:]
         forecast_values = None
         
         if forecast_df is not None and not forecast_df.empty and 'value' in forecast_df.columns:
-            forecast_values = forecast_df['value']
+            forecast_values = forecast_df['value'].to_numpy(dtype=float)
         
-        recent_trend = recent_values.pct_change().mean() * 100
+        # Mean month-over-month change, ignoring gaps in the series
+        with np.errstate(divide='ignore', invalid='ignore'):
+            recent_changes = np.diff(recent_values) / recent_values[:-1]
+        recent_changes = recent_changes[~np.isnan(recent_changes)]
+        recent_trend = recent_changes.mean() * 100 if recent_changes.size else np.nan
         forecast_trend = 0
         
         if forecast_values is not None and len(forecast_values) >= 2:
-            forecast_trend = (forecast_values.iloc[-1] - forecast_values.iloc[0]) / forecast_values.iloc[0] * 100
+            forecast_trend = (forecast_values[-1] - forecast_values[0]) / forecast_values[0] * 100
         
         combined_trend = (recent_trend + forecast_trend) / 2 if forecast_values is not None else recent_trend
         
@@ -680,206 +997,202 @@ def create_correlation_matrix(indicators):
     if not indicators or len(indicators) < 2:
         return pd.DataFrame()
     
-    monthly_data = {}
+    monthly_data = []
     for indicator_id, df_info in indicators.items():
         df = df_info[0]  # Get the DataFrame from the tuple
         if not df.empty and 'Date' in df.columns and 'value' in df.columns:
-            df['YearMonth'] = df['Date'].dt.strftime('%Y-%m')
-            monthly = df.groupby('YearMonth').last().reset_index()
-            monthly_data[indicator_id] = monthly[['YearMonth', 'value']].rename(columns={'value': indicator_id})
+            # Bucket by calendar month on a DatetimeIndex without writing a key
+            # column back into df; naive dates so all series can be aligned
+            values = pd.Series(df['value'].to_numpy(), index=pd.DatetimeIndex(df['Date']), name=indicator_id)
+            if values.index.tz is not None:
+                values.index = values.index.tz_localize(None)
+            values = values[values.notna() & values.index.notna()]
+            if not values.index.is_monotonic_increasing:
+                values = values.sort_index(kind='stable')
+            
+            # Loaded frames are already sorted by Date, so the last observation
+            # of each month is the row before the month changes
+            months = values.index.to_numpy().astype('datetime64[M]')
+            is_last = np.ones(len(months), dtype=bool)
+            is_last[:-1] = months[1:] != months[:-1]
+            monthly_data.append(pd.Series(values.to_numpy()[is_last],
+                                          index=pd.DatetimeIndex(months[is_last].astype('datetime64[ns]')),
+                                          name=indicator_id))
     
     if len(monthly_data) < 2:
         return pd.DataFrame()
     
-    merged_df = None
-    for indicator_id, df in monthly_data.items():
-        if merged_df is None:
-            merged_df = df
-        else:
-            merged_df = pd.merge(merged_df, df, on='YearMonth', how='outer')
-    
-    if merged_df is not None and merged_df.shape[1] > 1:
-        merged_df = merged_df.drop('YearMonth', axis=1)
-        return merged_df.corr()
-    
-    return pd.DataFrame()
+    # Align all indicators on month in a single outer join
+    merged_df = pd.concat(monthly_data, axis=1, join='outer')
+    return merged_df.corr()
+
+# Default metadata used when a data file does not provide it. Built once at
+# import so each lookup is a single dict access.
+DEFAULT_SOURCE_NAMES = {
+    'cruspi': "CRU Steel Price Index",
+    'cruspi_long': "CRU Long Products Index",
+    'wti_oil': "WTI Crude Oil Price",
+    'supply_chain': "NY Fed Supply Chain Pressure Index",
+    'ppi_steel_scrap': "BLS Steel Scrap Price Index",
+    'pmi_input_us': "ISM Manufacturing PMI Input Prices",
+    'ism_supplier_deliveries': "ISM Supplier Deliveries Index",
+    'baltic_dry_index': "Baltic Dry Index (BDIY Index)",
+    'dollar_index': "US Dollar Index (DXY Curncy)",
+    'empire_prices_paid': "NY Fed Empire State Manufacturing 6M Ahead Prices Paid",
+    # Added cost indicators
+    'komatsu_equipment': "Komatsu Heavy Equipment Cost Index",
+    'sms_equipment': "SMS Equipment Cost Index",
+    'caterpillar_equipment': "Caterpillar Equipment Cost Index",
+    'fabricated_steel': "Fabricated Structural Steel Cost Index",
+    'cement_ready_mix': "Cement and Ready-Mix Cost Index",
+    'explosives': "Explosives & Accessories Cost Index"
+}
+
+DEFAULT_UNITS = {
+    'wti_oil': '$',
+    'empire_prices_paid': '',
+    # Cost indicators are index values
+    'komatsu_equipment': '',
+    'sms_equipment': '',
+    'caterpillar_equipment': '',
+    'fabricated_steel': '',
+    'cement_ready_mix': '',
+    'explosives': ''
+}
+
+DEFAULT_PREFERRED_DIRECTIONS = {
+    'supply_chain': 'down',
+    'pmi_input_us': 'down',
+    'ppi_steel_scrap': 'down',
+    'wti_oil': 'down',
+    'ism_supplier_deliveries': 'down',
+    'empire_prices_paid': 'down',
+    'cruspi': 'neutral',
+    'cruspi_long': 'neutral',
+    'baltic_dry_index': 'neutral',
+    'dollar_index': 'neutral',
+    # For cost indicators, lower is generally better
+    'komatsu_equipment': 'down',
+    'sms_equipment': 'down',
+    'caterpillar_equipment': 'down',
+    'fabricated_steel': 'down',
+    'cement_ready_mix': 'down',
+    'explosives': 'down'
+}
+
+DEFAULT_DESCRIPTIONS = {
+    'cruspi': 'CRU Steel Price Index tracks steel price movements globally',
+    'cruspi_long': 'CRU Steel Price Index for Long Products tracks price movements for steel long products',
+    'wti_oil': 'West Texas Intermediate Crude Oil price, U.S. benchmark for oil prices',
+    'supply_chain': 'Tracks global supply chain conditions (negative values = lower pressure)',
+    'ppi_steel_scrap': 'Producer Price Index for Metals and Metal Products: Carbon Steel Scrap',
+    'pmi_input_us': 'PMI Input Prices index tracks price changes paid by manufacturers',
+    'ism_supplier_deliveries': 'ISM Manufacturing Report on Business Supplier Deliveries Index. Values above 50 indicate slower deliveries, values below 50 indicate faster deliveries.',
+    'baltic_dry_index': 'The Baltic Dry Index is a shipping and trade index measuring changes in the cost of transporting various raw materials. It serves as an indicator of global trade volume and economic activity.',
+    'dollar_index': 'The US Dollar Index measures the value of the US dollar relative to a basket of foreign currencies. A higher index indicates a stronger dollar relative to other major currencies.',
+    'empire_prices_paid': 'Empire State Manufacturing Survey 6-Month Ahead Prices Paid measures future inflation expectations in the NY manufacturing sector. Values reflect expected price changes over the next 6 months.',
+    # Add descriptions for cost indicators
+    'komatsu_equipment': 'Composite cost index for Komatsu Heavy Equipment based on weighted BLS PPI components',
+    'sms_equipment': 'Composite cost index for SMS Equipment based on weighted BLS PPI components',
+    'caterpillar_equipment': 'Composite cost index for Caterpillar Equipment based on weighted BLS PPI components',
+    'fabricated_steel': 'Composite cost index for Fabricated Structural Steel based on weighted BLS PPI components',
+    'cement_ready_mix': 'Composite cost index for Cement and Ready-Mix based on weighted BLS PPI components',
+    'explosives': 'Composite cost index for Explosives & Accessories based on weighted BLS PPI components'
+}
 
 def get_default_source_name(indicator_id):
     """Return default source name for an indicator."""
-    sources = {
-        'cruspi': "CRU Steel Price Index",
-        'cruspi_long': "CRU Long Products Index",
-        'wti_oil': "WTI Crude Oil Price",
-        'supply_chain': "NY Fed Supply Chain Pressure Index",
-        'ppi_steel_scrap': "BLS Steel Scrap Price Index",
-        'pmi_input_us': "ISM Manufacturing PMI Input Prices",
-        'ism_supplier_deliveries': "ISM Supplier Deliveries Index",
-        'baltic_dry_index': "Baltic Dry Index (BDIY Index)",
-        'dollar_index': "US Dollar Index (DXY Curncy)",
-        'empire_prices_paid': "NY Fed Empire State Manufacturing 6M Ahead Prices Paid",
-        # Added cost indicators
-        'komatsu_equipment': "Komatsu Heavy Equipment Cost Index",
-        'sms_equipment': "SMS Equipment Cost Index",
-        'caterpillar_equipment': "Caterpillar Equipment Cost Index",
-        'fabricated_steel': "Fabricated Structural Steel Cost Index",
-        'cement_ready_mix': "Cement and Ready-Mix Cost Index",
-        'explosives': "Explosives & Accessories Cost Index"
-    }
-    return sources.get(indicator_id, indicator_id.replace('_', ' ').title())
+    return DEFAULT_SOURCE_NAMES.get(indicator_id, indicator_id.replace('_', ' ').title())
 
 def get_default_unit(indicator_id):
     """Return default unit for an indicator."""
-    units = {
-        'wti_oil': '$',
-        'empire_prices_paid': '',
-        # Cost indicators are index values
-        'komatsu_equipment': '',
-        'sms_equipment': '',
-        'caterpillar_equipment': '',
-        'fabricated_steel': '',
-        'cement_ready_mix': '',
-        'explosives': ''
-    }
-    return units.get(indicator_id, '')
+    return DEFAULT_UNITS.get(indicator_id, '')
 
 def get_default_preferred_direction(indicator_id):
     """Return default preferred direction for an indicator."""
-    directions = {
-        'supply_chain': 'down',
-        'pmi_input_us': 'down',
-        'ppi_steel_scrap': 'down',
-        'wti_oil': 'down',
-        'ism_supplier_deliveries': 'down',
-        'empire_prices_paid': 'down',
-        'cruspi': 'neutral',
-        'cruspi_long': 'neutral',
-        'baltic_dry_index': 'neutral',
-        'dollar_index': 'neutral',
-        # For cost indicators, lower is generally better
-        'komatsu_equipment': 'down',
-        'sms_equipment': 'down',
-        'caterpillar_equipment': 'down',
-        'fabricated_steel': 'down',
-        'cement_ready_mix': 'down',
-        'explosives': 'down'
-    }
-    return directions.get(indicator_id, 'neutral')
+    return DEFAULT_PREFERRED_DIRECTIONS.get(indicator_id, 'neutral')
 
 def get_default_description(indicator_id):
     """Return default description for an indicator."""
-    descriptions = {
-        'cruspi': 'CRU Steel Price Index tracks steel price movements globally',
-        'cruspi_long': 'CRU Steel Price Index for Long Products tracks price movements for steel long products',
-        'wti_oil': 'West Texas Intermediate Crude Oil price, U.S. benchmark for oil prices',
-        'supply_chain': 'Tracks global supply chain conditions (negative values = lower pressure)',
-        'ppi_steel_scrap': 'Producer Price Index for Metals and Metal Products: Carbon Steel Scrap',
-        'pmi_input_us': 'PMI Input Prices index tracks price changes paid by manufacturers',
-        'ism_supplier_deliveries': 'ISM Manufacturing Report on Business Supplier Deliveries Index. Values above 50 indicate slower deliveries, values below 50 indicate faster deliveries.',
-        'baltic_dry_index': 'The Baltic Dry Index is a shipping and trade index measuring changes in the cost of transporting various raw materials. It serves as an indicator of global trade volume and economic activity.',
-        'dollar_index': 'The US Dollar Index measures the value of the US dollar relative to a basket of foreign currencies. A higher index indicates a stronger dollar relative to other major currencies.',
-        'empire_prices_paid': 'Empire State Manufacturing Survey 6-Month Ahead Prices Paid measures future inflation expectations in the NY manufacturing sector. Values reflect expected price changes over the next 6 months.',
-        # Add descriptions for cost indicators
-        'komatsu_equipment': 'Composite cost index for Komatsu Heavy Equipment based on weighted BLS PPI components',
-        'sms_equipment': 'Composite cost index for SMS Equipment based on weighted BLS PPI components',
-        'caterpillar_equipment': 'Composite cost index for Caterpillar Equipment based on weighted BLS PPI components',
-        'fabricated_steel': 'Composite cost index for Fabricated Structural Steel based on weighted BLS PPI components',
-        'cement_ready_mix': 'Composite cost index for Cement and Ready-Mix based on weighted BLS PPI components',
-        'explosives': 'Composite cost index for Explosives & Accessories based on weighted BLS PPI components'
-    }
-    return descriptions.get(indicator_id, f"{indicator_id.replace('_', ' ').title()} indicator")
+    return DEFAULT_DESCRIPTIONS.get(indicator_id, f"{indicator_id.replace('_', ' ').title()} indicator")
 
 # Function to generate sample data for an indicator
+# Name fragments of the cost indicators that carry a yearly adjustment column
+COST_INDICATOR_TOKENS = ('equipment', 'steel', 'cement', 'explosives')
+
+# Sample (base_value, monthly trend %, volatility %) by cost token or indicator id
+SAMPLE_PARAMS = {
+    'equipment': (180.0, 0.3, 1.5),
+    'steel': (200.0, 0.4, 2.0),
+    'cement': (220.0, 0.25, 1.2),
+    'explosives': (175.0, 0.35, 1.8),
+    'wti_oil': (75.0, 0.2, 2.5),
+    'supply_chain': (0.5, -0.1, 0.2),
+}
+DEFAULT_SAMPLE_PARAMS = (100.0, 0.5, 1.0)
+
+@lru_cache(maxsize=64)
+def get_sample_params(indicator_id):
+    """Return (base_value, trend, volatility) for an indicator's sample data."""
+    category = next((token for token in COST_INDICATOR_TOKENS if token in indicator_id), indicator_id)
+    return SAMPLE_PARAMS.get(category, DEFAULT_SAMPLE_PARAMS)
+
 def generate_sample_data(indicator_id):
-    """Generate sample data for an indicator if it's not found in data files."""
+    """Generate sample data for an indicator if it's not found in data files.
+
+    The series only depends on the indicator and the current month, so it is
+    built once per month and a copy is returned.
+    """
+    now = datetime.now()
+    return build_sample_data(indicator_id, now.year, now.month).copy()
+
+@lru_cache(maxsize=64)
+def build_sample_data(indicator_id, year, month):
+    """Build the two-year sample series for an indicator ending in the given month."""
     logger.info(f"Generating sample data for {indicator_id}")
     
-    # Current date and two years back for sample data range
-    end_date = datetime.now()
-    start_date = datetime(end_date.year - 2, end_date.month, 1)
+    # Current month and two years back for sample data range
+    start_date = datetime(year - 2, month, 1)
+    end_date = datetime(year, month, 1)
     
     # Create monthly dates
     dates = pd.date_range(start=start_date, end=end_date, freq='MS')
     
-    # Variables for different indicator types
-    base_value = 100.0
-    trend = 0.5  # Default monthly percentage increase
-    volatility = 1.0
-    
-    # Customize parameters based on indicator type
-    if 'equipment' in indicator_id:
-        base_value = 180.0
-        trend = 0.3
-        volatility = 1.5
-    elif 'steel' in indicator_id:
-        base_value = 200.0
-        trend = 0.4
-        volatility = 2.0
-    elif 'cement' in indicator_id:
-        base_value = 220.0
-        trend = 0.25
-        volatility = 1.2
-    elif 'explosives' in indicator_id:
-        base_value = 175.0
-        trend = 0.35
-        volatility = 1.8
-    elif indicator_id == 'wti_oil':
-        base_value = 75.0
-        trend = 0.2
-        volatility = 2.5
-    elif indicator_id == 'supply_chain':
-        base_value = 0.5
-        trend = -0.1
-        volatility = 0.2
-    
-    # Generate values with realistic patterns
-    values = []
-    yearly_adjustments = []
-    
-    for i, date in enumerate(dates):
-        if i == 0:
-            # First value is base
-            value = base_value
-        else:
-            # Calculate month's change with seasonal component
-            month = date.month
-            seasonal = 0.2 * np.sin(2 * np.pi * month / 12)
-            monthly_change = (trend / 100) + seasonal + np.random.normal(0, volatility / 100)
-            
-            # Apply to previous value
-            value = values[-1] * (1 + monthly_change)
-        
-        values.append(value)
-        
-        # For cost indicators, add a yearly adjustment column (random value between 2-5%)
-        # This is calculated as the YoY percentage change
-        if 'equipment' in indicator_id or 'steel' in indicator_id or 'cement' in indicator_id or 'explosives' in indicator_id:
-            if i >= 12:  # Only after we have a full year of data
-                yearly_adj = ((value / values[i-12]) - 1) * 100
-                yearly_adjustments.append(yearly_adj)
-            else:
-                yearly_adjustments.append(np.nan)
-        else:
-            yearly_adjustments.append(np.nan)
+    # Seed from the indicator id so each indicator has a stable series
+    rng = sample_rng(indicator_id)
     
-    # Create DataFrame
-    df = pd.DataFrame({
-        'Date': dates,
-        'value': values,
-        'yearly_adjustment': yearly_adjustments
-    })
+    # Parameters for the indicator type
+    base_value, trend, volatility = get_sample_params(indicator_id)
     
-    # Add calculated columns
-    df['monthly_change'] = df['value'].pct_change() * 100
-    df['yoy_change'] = df['value'].pct_change(12) * 100
+    # Generate values with realistic patterns: each month compounds the trend,
+    # a seasonal component and noise onto the previous value
+    seasonal = 0.2 * np.sin(2 * np.pi * dates.month.values / 12)
+    growth = np.ones(len(dates))
+    growth[1:] = 1 + (trend / 100) + seasonal[1:] + rng.normal(0, volatility / 100, len(dates) - 1)
+    # Compound in float64, store in float32 like loaded data
+    values = (base_value * np.cumprod(growth)).astype(np.float32)
     
-    # Add metadata
-    df['source'] = get_default_source_name(indicator_id) + " (Sample Data)"
-    df['indicator_id'] = indicator_id
-    df['unit'] = get_default_unit(indicator_id)
-    df['preferred_direction'] = get_default_preferred_direction(indicator_id)
-    df['description'] = get_default_description(indicator_id) + " (Sample Data)"
+    # For cost indicators, the yearly adjustment column is the YoY percentage
+    # change itself (only after we have a full year of data)
+    yoy_changes = percent_change(values, 12)
+    if any(token in indicator_id for token in COST_INDICATOR_TOKENS):
+        yearly_adjustments = yoy_changes
+    else:
+        yearly_adjustments = np.full(len(values), np.nan, dtype=np.float32)
     
-    return df
+    # Create DataFrame; metadata scalars are broadcast by the constructor
+    return pd.DataFrame({
+        'Date': dates,
+        'value': values,
+        'yearly_adjustment': yearly_adjustments,
+        'monthly_change': percent_change(values, 1),
+        'yoy_change': yoy_changes,
+        'source': get_default_source_name(indicator_id) + " (Sample Data)",
+        'indicator_id': indicator_id,
+        'unit': get_default_unit(indicator_id),
+        'preferred_direction': get_default_preferred_direction(indicator_id),
+        'description': get_default_description(indicator_id) + " (Sample Data)"
+    })
 
 def generate_sample_forecast(indicator_id):
     """Generate sample forecast data for an indicator."""
@@ -890,53 +1203,28 @@ def generate_sample_forecast(indicator_id):
     dates = pd.date_range(start=current_month, periods=6, freq='MS')
     
     # Base value - should match with end of historical data
-    base_value = 100.0
-    
-    # Customize base value by indicator type
-    if 'equipment' in indicator_id:
-        base_value = 180.0
-    elif 'steel' in indicator_id:
-        base_value = 200.0
-    elif 'cement' in indicator_id:
-        base_value = 220.0
-    elif 'explosives' in indicator_id:
-        base_value = 175.0
-    elif indicator_id == 'wti_oil':
-        base_value = 75.0
-    elif indicator_id == 'supply_chain':
-        base_value = 0.5
-    
-    # Generate forecast values with mild trend and some volatility
-    values = []
-    trend = 0.002  # Default mild monthly increase
+    base_value = get_sample_params(indicator_id)[0]
     
-    # Use smaller randomness for first value to avoid discontinuity
-    for i in range(len(dates)):
-        if i == 0:
-            # First forecast value - less randomness
-            value = base_value * (1 + np.random.normal(0, 0.002))
-        else:
-            # Subsequent values follow a mild trend with gradually increasing randomness
-            value = values[-1] * (1 + trend + np.random.normal(0, 0.002 * (i+1)))
-        
-        values.append(value)
+    # Generate forecast values with a mild trend and randomness that grows
+    # with the horizon; the first value gets no trend to avoid a discontinuity
+    trend = 0.002  # Default mild monthly increase
+    steps = np.arange(len(dates), dtype=np.float32)
+    monthly_trend = np.where(steps == 0, 0.0, trend)
+    growth = 1 + monthly_trend + sample_rng(f"{indicator_id}_forecast").normal(0, 0.002 * (steps + 1))
+    values = (base_value * np.cumprod(growth)).astype(np.float32)
     
     # Create confidence intervals that widen with time - starting narrow
-    lower_ci = [val * (1 - 0.005 - 0.003*i) for i, val in enumerate(values)]
-    upper_ci = [val * (1 + 0.005 + 0.003*i) for i, val in enumerate(values)]
+    lower_ci = values * (1 - 0.005 - 0.003 * steps)
+    upper_ci = values * (1 + 0.005 + 0.003 * steps)
     
-    # Create DataFrame
-    df = pd.DataFrame({
+    # Create DataFrame; metadata scalars are broadcast by the constructor
+    return pd.DataFrame({
         'Date': dates,
         'value': values,
         'lower_ci': lower_ci,
         'upper_ci': upper_ci,
-    })
-    
-    # Add metadata
-    df['source'] = f"{get_default_source_name(indicator_id)} - FORECAST (Sample)"
-    df['indicator_id'] = indicator_id
-    df['unit'] = get_default_unit(indicator_id)
-    df['preferred_direction'] = get_default_preferred_direction(indicator_id)
-    
-    return df
\ No newline at end of file
+        'source': f"{get_default_source_name(indicator_id)} - FORECAST (Sample)",
+        'indicator_id': indicator_id,
+        'unit': get_default_unit(indicator_id),
+        'preferred_direction': get_default_preferred_direction(indicator_id),
+    })
\ No newline at end of file
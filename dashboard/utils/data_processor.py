@@ -4,6 +4,8 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import base64
+from functools import lru_cache
+import io
 import logging
 
 # Set up logging
@@ -15,16 +17,11 @@ def filter_time_period(df, time_period):
     if df is None or df.empty or 'Date' not in df.columns:
         return df
     
-    # Create a copy to avoid modifying the original
-    filtered_df = df.copy()
-    
-    # Ensure we are getting the absolute latest data by setting end_date to the max of the dataframe
-    # This avoids any filtering issue that might exclude the most recent data point
-    end_date = filtered_df['Date'].max()
-    
-    # Add explicit debugging for the latest date
-    latest_date = filtered_df['Date'].max()
-    logger.info(f"Latest date in original data: {latest_date}")
+    # Loaded frames are sorted by Date, so the latest date is the last row
+    dates = df['Date']
+    is_sorted = dates.is_monotonic_increasing
+    end_date = dates.iat[-1] if is_sorted else dates.max()
+    logger.info(f"Latest date in original data: {end_date}")
     
     if time_period == "Last 6 Months":
         # Make sure to use the latest date minus 6 months, not today - 6 months
@@ -34,22 +31,16 @@ def filter_time_period(df, time_period):
     elif time_period == "Last 24 Months":
         start_date = end_date - pd.DateOffset(months=24)
     else:
-        start_date = filtered_df['Date'].min()
-    
-    # Explicitly include the end_date to ensure the most recent data is included
-    # Use inclusive bounds on both sides to avoid any filtering errors
-    result_df = filtered_df[(filtered_df['Date'] >= start_date) & (filtered_df['Date'] <= end_date)]
-    
-    # Double-check that the latest date is included by logging it
-    if not result_df.empty:
-        result_latest = result_df['Date'].max()
-        logger.info(f"Latest date in filtered data for time period {time_period}: {result_latest}")
-        # If we lost the latest date, add it back
-        if result_latest != latest_date:
-            logger.warning(f"Latest date was filtered out! Adding it back manually.")
-            latest_row = filtered_df[filtered_df['Date'] == latest_date]
-            result_df = pd.concat([result_df, latest_row]).drop_duplicates()
+        return df
+    
+    # The window always ends at the latest date, so sorted frames only need a
+    # positional slice; results are views, not copies
+    if is_sorted:
+        result_df = df.iloc[dates.searchsorted(start_date, side='left'):]
+    else:
+        result_df = df[dates >= start_date]
     
+    logger.info(f"Latest date in filtered data for time period {time_period}: {end_date}")
     return result_df
 
 def download_link(df, filename, link_text):
@@ -58,118 +49,122 @@ def download_link(df, filename, link_text):
         return f'<a href="#" class="download-button disabled">{link_text} (No data)</a>'
     
     try:
-        csv = df.to_csv(index=False)
-        b64 = base64.b64encode(csv.encode()).decode()
+        # Write the CSV bytes straight into a buffer and encode them in place
+        buffer = io.BytesIO()
+        df.to_csv(buffer, index=False, encoding='utf-8')
+        b64 = base64.b64encode(buffer.getbuffer()).decode('ascii')
         href = f'<a href="data:file/csv;base64,{b64}" download="{filename}" class="download-button">{link_text}</a>'
         return href
     except Exception as e:
         logger.error(f"Error creating download link: {e}")
         return f'<a href="#" class="download-button disabled">{link_text} (Error)</a>'
 
+# Value formatters by unit; anything else is shown as a plain number
+VALUE_FORMATS = {
+    '$': "${:.2f}".format,
+    '%': "{:.2f}%".format,
+}
+
 def format_metric_value(value, unit=''):
     """Format metric value with appropriate unit."""
     if pd.isna(value):
         return "N/A"
     
-    if unit == '$':
-        return f"${value:.2f}"
-    elif unit == '%':
-        return f"{value:.2f}%"
-    else:
-        return f"{value:.2f}"
+    return VALUE_FORMATS.get(unit, "{:.2f}".format)(value)
+
+# Change styles by (preferred_direction, change > 0); neutral preferences
+# are never colored
+CHANGE_STYLES = {
+    ('down', True): "negative-change",
+    ('down', False): "positive-change",
+    ('up', True): "positive-change",
+    ('up', False): "negative-change",
+}
 
 def format_change(change, preferred_direction='neutral', use_absolute=False):
     """Format change value with appropriate color and sign."""
     if pd.isna(change):
         return "N/A", "neutral-change"
     
-    # For certain metrics like supply chain index, use absolute change
-    if use_absolute:
-        sign = "+" if change > 0 else ""
-        if preferred_direction == 'down':
-            style = "negative-change" if change > 0 else "positive-change"
-        elif preferred_direction == 'up':
-            style = "positive-change" if change > 0 else "negative-change"
-        else:  # neutral
-            style = "neutral-change"
-        
-        return f"{sign}{change:.2f}", style
-    else:
-        # Use percentage for other metrics
-        sign = "+" if change > 0 else ""
-        if preferred_direction == 'down':
-            style = "negative-change" if change > 0 else "positive-change"
-        elif preferred_direction == 'up':
-            style = "positive-change" if change > 0 else "negative-change"
-        else:  # neutral
-            style = "neutral-change"
-        
-        return f"{sign}{change:.2f}%", style
+    increased = bool(change > 0)
+    sign = "+" if increased else ""
+    style = CHANGE_STYLES.get((preferred_direction, increased), "neutral-change")
+    
+    # For certain metrics like supply chain index, use absolute change;
+    # percentage for the others
+    suffix = "" if use_absolute else "%"
+    return f"{sign}{change:.2f}{suffix}", style
+
+# Indicators whose impact is judged as if lower values were better,
+# whatever their preferred_direction says
+IMPACT_DIRECTION_OVERRIDES = {
+    'wti_oil': 'down',  # Lower commodity prices reduce costs
+    'ppi_steel_scrap': 'down',
+    'dollar_index': 'down',  # A weaker dollar tends to help US exporters
+    'baltic_dry_index': 'down',  # Lower shipping costs are generally better
+}
+
+def build_impact_table():
+    """Map (direction, sign of change, is_significant) to (symbol, style_class, impact)."""
+    table = {}
+    for significant in (False, True):
+        for sign in (-1, 0, 1):
+            rising_symbol = "↑" if sign > 0 else "↓"
+            rules = {
+                # For metrics where decrease is good (like supply chain pressure, costs)
+                'down': ("positive" if sign < 0 else ("negative" if significant else "neutral"),
+                         "↓" if sign < 0 else "↑"),
+                # For metrics where increase is good
+                'up': ("positive" if sign > 0 else ("negative" if significant else "neutral"),
+                       rising_symbol),
+                # Even for neutral preference indicators, significant movements have impact;
+                # default to the cost perspective where increases imply higher costs
+                'neutral': (("negative" if sign > 0 else "positive") if significant else "neutral",
+                            rising_symbol),
+            }
+            for direction, (impact, symbol) in rules.items():
+                table[(direction, sign, significant)] = (symbol, f"{impact}-impact", impact)
+    return table
+
+IMPACT_TABLE = build_impact_table()
 
 def get_impact_indicator(change, preferred_direction='neutral', use_absolute=False, indicator_id=None):
     """Return impact indicator (↑/↓) with styling classes, properly accounting for business impact."""
     if pd.isna(change):
         return "", "neutral-impact", "neutral"
     
-    # Set significance thresholds - these determine when a change is significant enough to have an impact
-    significance_threshold = 2.0  # Default for percentage changes
-    
-    if use_absolute:
-        significance_threshold = 0.1  # Different threshold for absolute changes (like supply chain index)
-    
-    # Check if the change is significant
-    is_significant = abs(change) > significance_threshold
+    # Changes count as significant above 2% or, for absolute changes
+    # (like the supply chain index), above 0.1
+    significance_threshold = 0.1 if use_absolute else 2.0
     
-    # Handle special cases for specific indicators
-    if indicator_id:
-        # For commodity prices like oil, significant decreases are positive for most businesses (reduced costs)
-        if indicator_id in ['wti_oil', 'ppi_steel_scrap']:
-            preferred_direction = 'down'
-        
-        # For dollar index, weaker dollar (going down) tends to help US exporters
-        elif indicator_id == 'dollar_index':
-            preferred_direction = 'down'
-        
-        # For Baltic Dry Index, changes indicate shipping cost changes, lower is generally better
-        elif indicator_id == 'baltic_dry_index':
-            preferred_direction = 'down'
-    
-    if preferred_direction == 'down':
-        # For metrics where decrease is good (like supply chain pressure, costs)
-        impact = "positive" if change < 0 else ("negative" if is_significant else "neutral")
-        indicator = "↓" if change < 0 else "↑"
-    elif preferred_direction == 'up':
-        # For metrics where increase is good
-        impact = "positive" if change > 0 else ("negative" if is_significant else "neutral")
-        indicator = "↑" if change > 0 else "↓"
-    else:  # neutral
-        # Even for neutral preference indicators, significant movements should have impact
-        if is_significant:
-            # Default to cost perspective - increases in most indicators imply higher costs
-            impact = "negative" if change > 0 else "positive"
-        else:
-            impact = "neutral"
-        indicator = "↑" if change > 0 else "↓"
+    direction = IMPACT_DIRECTION_OVERRIDES.get(indicator_id, preferred_direction)
+    if direction not in ('up', 'down'):
+        direction = 'neutral'
     
-    style_class = f"{impact}-impact"
-    return indicator, style_class, impact
+    return IMPACT_TABLE[(direction, int(np.sign(change)), bool(abs(change) > significance_threshold))]
 
 def get_trend_indicator(last_values, forecast_values=None):
     """Determine trend direction based on recent values and forecast."""
     if last_values is None or len(last_values) < 2:
         return "→ Stable", "trend-stable"
     
-    # Calculate recent trend as percentage change
+    # Calculate recent trend as the mean month-over-month percentage change,
+    # ignoring gaps in the series
     recent_trend = 0
     try:
-        recent_trend = last_values.pct_change().mean() * 100
+        values = np.asarray(last_values, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            changes = np.diff(values) / values[:-1]
+        changes = changes[~np.isnan(changes)]
+        recent_trend = changes.mean() * 100 if changes.size else np.nan
     except Exception as e:
         logger.error(f"Error calculating recent trend: {e}")
     
     forecast_trend = 0
     if forecast_values is not None and len(forecast_values) >= 2:
         try:
-            forecast_trend = (forecast_values.iloc[-1] - forecast_values.iloc[0]) / forecast_values.iloc[0] * 100
+            forecast = np.asarray(forecast_values, dtype=float)
+            forecast_trend = (forecast[-1] - forecast[0]) / forecast[0] * 100
         except Exception as e:
             logger.error(f"Error calculating forecast trend: {e}")
     
@@ -180,4 +175,76 @@ def get_trend_indicator(last_values, forecast_values=None):
     elif combined_trend < -0.7:
         return "↓ Decreasing", "trend-down"
     else:
-        return "→ Stable", "trend-stable"
\ No newline at end of file
+        return "→ Stable", "trend-stable"
+
+def latest_snapshot(df):
+    """Return the last row's value, changes and preferred direction as a plain dict."""
+    # Read single cells instead of building a Series for the whole row
+    snapshot = {'monthly_change': 0, 'yoy_change': None, 'preferred_direction': 'down'}
+    for column in ('value', 'monthly_change', 'yoy_change', 'preferred_direction'):
+        if column in df.columns:
+            snapshot[column] = df[column].iat[-1]
+    return snapshot
+
+@lru_cache(maxsize=128)
+def generate_automated_commentary(indicator_id, latest_value, monthly_change, yoy_change, forecast_change=None, preferred_direction='neutral'):
+    """Generate automated commentary based on indicator metrics.
+    
+    Cached because the Main Dashboard asks for the same commentary on every rerun.
+    """
+    
+    commentary = ""
+    
+    if indicator_id == 'supply_chain':
+        if latest_value > 0:
+            level_desc = f"The current value of {latest_value:.2f} indicates above-average supply chain pressure."
+        else:
+            level_desc = f"The current value of {latest_value:.2f} indicates below-average supply chain pressure."
+            
+        if monthly_change < -0.2:
+            monthly_desc = f"Supply chain pressure has notably decreased by {abs(monthly_change):.2f} points over the last month, a positive development."
+        elif monthly_change < 0:
+            monthly_desc = f"Supply chain pressure has slightly decreased by {abs(monthly_change):.2f} points over the last month."
+        elif monthly_change < 0.2:
+            monthly_desc = f"Supply chain pressure has remained relatively stable with a small increase of {monthly_change:.2f} points over the last month."
+        else:
+            monthly_desc = f"Supply chain pressure has increased by {monthly_change:.2f} points over the last month, indicating worsening conditions."
+            
+        if forecast_change:
+            if forecast_change < 0:
+                forecast_desc = f"The forecast indicates improving conditions with a projected {abs(forecast_change):.2f} point decrease in pressure over the next few months."
+            else:
+                forecast_desc = f"The forecast suggests continued challenges with a projected {forecast_change:.2f} point increase in pressure over the next few months."
+        else:
+            forecast_desc = ""
+            
+        commentary = f"{level_desc} {monthly_desc} {forecast_desc}"
+        
+    elif indicator_id == 'empire_prices_paid':
+        if latest_value > 50:
+            level_desc = f"The current Empire Manufacturing Prices Paid index of {latest_value:.2f} indicates increasing input prices for manufacturers in New York state."
+        else:
+            level_desc = f"The current Empire Manufacturing Prices Paid index of {latest_value:.2f} indicates decreasing input prices for manufacturers in New York state."
+            
+        if monthly_change < -1:
+            monthly_desc = f"The index has decreased by {abs(monthly_change):.2f}% month-over-month, suggesting easing price pressures."
+        elif monthly_change < 1:
+            monthly_desc = f"The index has remained relatively stable month-over-month ({monthly_change:.2f}%)."
+        else:
+            monthly_desc = f"The index has increased by {monthly_change:.2f}% month-over-month, suggesting growing price pressures."
+            
+        if yoy_change and not pd.isna(yoy_change):
+            if yoy_change < -5:
+                yoy_desc = f"Year-over-year, prices paid have decreased significantly ({yoy_change:.2f}%), indicating substantial relief in input costs."
+            elif yoy_change < 0:
+                yoy_desc = f"Year-over-year, prices paid have moderated ({yoy_change:.2f}%)."
+            elif yoy_change < 5:
+                yoy_desc = f"Year-over-year, prices paid have increased moderately ({yoy_change:.2f}%)."
+            else:
+                yoy_desc = f"Year-over-year, prices paid have increased significantly ({yoy_change:.2f}%), indicating persistent inflation in input costs."
+        else:
+            yoy_desc = ""
+            
+        commentary = f"{level_desc} {monthly_desc} {yoy_desc}"
+    
+    return commentary
\ No newline at end of file
@@ -8,37 +8,56 @@ import os
 import sys
 import subprocess
 import logging
+import logging.handlers
+import queue
+import atexit
 import shutil
 import glob
+from concurrent.futures import ThreadPoolExecutor
 
-# Set up logging
+# Set up logging; records are queued and written to the console and log file
+# on a background thread so startup never waits on disk writes
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+log_handlers = [
+    logging.StreamHandler(),
+    logging.FileHandler('dashboard_run.log')
+]
+for handler in log_handlers:
+    handler.setFormatter(log_formatter)
+
+log_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(log_queue, *log_handlers)
+queue_handler = logging.handlers.QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter('%(message)s'))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('dashboard_run.log')
-    ]
+    handlers=[queue_handler]
 )
+log_listener.start()
+atexit.register(log_listener.stop)
 
 logger = logging.getLogger(__name__)
 
+def copy_data_file(src_file, dest_file):
+    """Copy one data file's contents, returning whether it succeeded."""
+    try:
+        # copyfile skips permission metadata and lets the OS copy in-kernel
+        shutil.copyfile(src_file, dest_file)
+        logger.debug("Copied %s to %s", src_file, dest_file)
+        return True
+    except Exception as e:
+        logger.error(f"Error copying {src_file}: {e}")
+        return False
+
 def ensure_data_dirs():
     """Ensure data directories exist and are properly set up."""
     data_dir = "data"
     subdirs = ["raw", "processed", "forecasts"]
     
-    # Check if data directory exists
-    if not os.path.exists(data_dir):
-        logger.info(f"Creating data directory at {data_dir}")
-        os.makedirs(data_dir, exist_ok=True)
-    
-    # Create subdirectories
+    # Create the subdirectories, and the data directory with them; existing
+    # directories are left alone
     for subdir in subdirs:
-        subdir_path = os.path.join(data_dir, subdir)
-        if not os.path.exists(subdir_path):
-            logger.info(f"Creating {subdir} subdirectory")
-            os.makedirs(subdir_path, exist_ok=True)
+        os.makedirs(os.path.join(data_dir, subdir), exist_ok=True)
     
     # Look for data files in indicator_data directory
     indicator_data_dir = os.path.expanduser("~/Commercial and Market Research/indicator_data")
@@ -53,27 +72,67 @@ def ensure_data_dirs():
         (os.path.join(alt_data_dir, "forecasts"), os.path.join(data_dir, "forecasts"))
     ]
     
-    files_copied = 0
-    
-    # Try to copy data files if data directories are empty
+    # Plan the copies first so a file offered by both source trees is only
+    # considered once, from the first source listed; it is copied when the
+    # local copy is missing or older than the source
+    planned = {}
+    seen = set()
     for src_dir, dest_dir in data_sources:
         if os.path.exists(src_dir):
             logger.info(f"Found source directory: {src_dir}")
             for file in glob.glob(os.path.join(src_dir, "*.csv")):
                 dest_file = os.path.join(dest_dir, os.path.basename(file))
-                if not os.path.exists(dest_file):
-                    try:
-                        shutil.copy(file, dest_file)
-                        logger.info(f"Copied {file} to {dest_file}")
-                        files_copied += 1
-                    except Exception as e:
-                        logger.error(f"Error copying {file}: {e}")
+                if dest_file in seen:
+                    continue
+                seen.add(dest_file)
+                if not os.path.exists(dest_file) or os.path.getmtime(file) > os.path.getmtime(dest_file):
+                    planned[dest_file] = file
+    
+    # Copy the files concurrently
+    files_copied = 0
+    if planned:
+        with ThreadPoolExecutor(max_workers=min(8, len(planned))) as executor:
+            files_copied = sum(executor.map(copy_data_file, planned.values(), planned.keys()))
     
     if files_copied > 0:
         logger.info(f"Copied {files_copied} data files to local data directory")
     else:
         logger.warning("No data files were copied. Sample data may be used instead.")
 
+# Usual main.py locations relative to the project root, checked before searching
+MAIN_PY_CANDIDATES = [
+    ("dashboard", "main.py"),
+    ("main.py",),
+    ("src", "main.py"),
+]
+
+# Directories never searched for main.py
+SKIP_DIRS = {".git", "__pycache__", "data", ".venv", "venv", "node_modules"}
+
+def find_main_py(project_root):
+    """Locate main.py, probing the usual locations before searching the tree."""
+    for parts in MAIN_PY_CANDIDATES:
+        path = os.path.join(project_root, *parts)
+        if os.path.isfile(path):
+            return path
+    
+    # Fall back to a scandir search that skips data and tooling directories
+    pending = [project_root]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            pending.append(entry.path)
+                    elif entry.name == "main.py":
+                        return entry.path
+        except OSError as e:
+            logger.error(f"Error searching {directory} for main.py: {e}")
+    
+    return None
+
 def run_dashboard():
     """Run the Streamlit dashboard with improved path handling."""
     # Get absolute path to project directory
@@ -93,18 +152,17 @@ def run_dashboard():
     # Log information about file structure
     logger.info("Checking file structure...")
     dashboard_dir = os.path.join(project_root, "dashboard")
-    main_py = os.path.join(dashboard_dir, "main.py")
+    expected_main_py = os.path.join(dashboard_dir, "main.py")
+    main_py = find_main_py(project_root)
     
-    if os.path.exists(main_py):
+    if main_py == expected_main_py:
         logger.info(f"Found main.py at: {main_py}")
     else:
-        logger.error(f"main.py not found at {main_py}")
-        # Try to find it elsewhere
-        for root, dirs, files in os.walk(project_root):
-            if "main.py" in files:
-                main_py = os.path.join(root, "main.py")
-                logger.info(f"Found main.py at alternative location: {main_py}")
-                break
+        logger.error(f"main.py not found at {expected_main_py}")
+        if main_py:
+            logger.info(f"Found main.py at alternative location: {main_py}")
+        else:
+            main_py = expected_main_py
     
     # Log Python path
     logger.info(f"Current Python path: {sys.path}")
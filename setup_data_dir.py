@@ -6,7 +6,8 @@ Copies sample data to the appropriate data folders
 
 import os
 import shutil
-import glob
+import hashlib
+import json
 import logging
 import sys
 from datetime import datetime
@@ -25,34 +26,39 @@ def ensure_dir_structure():
     
     logger.info(f"Creating data directory structure in {os.getcwd()}")
     
-    # Create main data directory if it doesn't exist
-    if not os.path.exists(data_dir):
-        os.makedirs(data_dir)
-        logger.info(f"Created data directory: {data_dir}")
-    
-    # Create subdirectories
+    # Create the subdirectories, and the data directory with them; existing
+    # directories are left alone
     for subdir in subdirs:
-        subdir_path = os.path.join(data_dir, subdir)
-        if not os.path.exists(subdir_path):
-            os.makedirs(subdir_path)
-            logger.info(f"Created subdirectory: {subdir_path}")
+        os.makedirs(os.path.join(data_dir, subdir), exist_ok=True)
+
+# Data directories searched for sample files, in priority order
+SAMPLE_DATA_DIRS = [
+    ("indicator_data", "raw"),
+    ("indicator_data", "processed"),
+    ("indicator_data", "forecasts"),
+    ("data", "raw"),
+    ("data", "processed"),
+    ("data", "forecasts"),
+]
+
+# Directories never searched for sample files
+SKIP_DIRS = {"venv", "__pycache__", "node_modules"}
 
 def find_sample_data():
     """Find sample data files in the project directory."""
-    # Patterns to search for
-    patterns = [
-        "**/indicator_data/raw/*.csv",
-        "**/indicator_data/processed/*.csv",
-        "**/indicator_data/forecasts/*.csv",
-        "**/data/raw/*.csv",
-        "**/data/processed/*.csv",
-        "**/data/forecasts/*.csv"
-    ]
+    # Walk the project once, skipping hidden and tooling directories, and
+    # group the CSVs by which data directory they sit in
+    matches = {data_dir: [] for data_dir in SAMPLE_DATA_DIRS}
+    for root, dirs, files in os.walk(os.curdir):
+        dirs[:] = [d for d in dirs if not d.startswith('.') and d not in SKIP_DIRS]
+        data_dir = tuple(os.path.normpath(root).split(os.sep)[-2:])
+        if data_dir in matches:
+            matches[data_dir].extend(os.path.normpath(os.path.join(root, file)) for file in files
+                                     if file.endswith('.csv') and not file.startswith('.'))
     
     found_files = []
-    for pattern in patterns:
-        matches = glob.glob(pattern, recursive=True)
-        for match in matches:
+    for data_dir in SAMPLE_DATA_DIRS:
+        for match in matches[data_dir]:
             logger.info(f"Found data file: {match}")
             found_files.append(match)
     
@@ -73,6 +79,23 @@ def find_sample_data():
     logger.info(f"Found {len(found_files)} sample data files")
     return found_files
 
+def index_dir_mtimes(path):
+    """Return a mapping of file name to mtime for the files directly in path."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry.stat().st_mtime for entry in entries if entry.is_file()}
+    except OSError:
+        return {}
+
+def copy_file_contents(source_file, dest_file):
+    """Copy a file's contents and modification time; return the source mtime."""
+    # Carrying the mtime over lets a newer duplicate from another data
+    # directory replace an older copy, as shutil.copy2 did
+    st = os.stat(source_file)
+    shutil.copyfile(source_file, dest_file)
+    os.utime(dest_file, (st.st_atime, st.st_mtime))
+    return st.st_mtime
+
 def copy_data_files(source_files):
     """Copy sample data files to the data directory."""
     # Map to track where each file should go
@@ -82,6 +105,9 @@ def copy_data_files(source_files):
         "forecasts": os.path.join("data", "forecasts")
     }
     
+    # Read each destination directory once instead of stat-ing every candidate
+    dest_index = {key: index_dir_mtimes(dest_dir) for key, dest_dir in dest_map.items()}
+    
     copied_count = 0
     cruspi_processed = False
     
@@ -92,12 +118,12 @@ def copy_data_files(source_files):
             try:
                 # Copy to raw directory as is
                 raw_dest_file = os.path.join(dest_map["raw"], "cruspi_direct.csv")
-                shutil.copy2(source_file, raw_dest_file)
+                copy_file_contents(source_file, raw_dest_file)
                 logger.info(f"Copied CRUspi direct data to: {raw_dest_file}")
                 
                 # Also create processed version with standardized name for easier loading
                 processed_dest_file = os.path.join(dest_map["processed"], "cruspi.csv")
-                shutil.copy2(source_file, processed_dest_file)
+                copy_file_contents(source_file, processed_dest_file)
                 logger.info(f"Copied CRUspi direct data to processed dir: {processed_dest_file}")
                 
                 # Mark CRUspi as processed to avoid copying sample data
@@ -120,11 +146,11 @@ def copy_data_files(source_files):
                 dest_file = os.path.join(dest_dir, filename)
                 
                 # Only copy if destination doesn't exist or source is newer
-                if not os.path.exists(dest_file) or \
-                   os.path.getmtime(source_file) > os.path.getmtime(dest_file):
+                dest_mtime = dest_index[key].get(filename)
+                if dest_mtime is None or os.path.getmtime(source_file) > dest_mtime:
                     try:
-                        shutil.copy2(source_file, dest_file)
-                        logger.info(f"Copied {source_file} to {dest_file}")
+                        dest_index[key][filename] = copy_file_contents(source_file, dest_file)
+                        logger.debug("Copied %s to %s", source_file, dest_file)
                         copied_count += 1
                     except Exception as e:
                         logger.error(f"Failed to copy {source_file}: {e}")
@@ -133,11 +159,40 @@ def copy_data_files(source_files):
     logger.info(f"Copied {copied_count} files to data directory")
     return copied_count
 
+# Records which settings each generated sample file was built from
+SAMPLE_VERSIONS_FILE = os.path.join("data", "processed", ".sample_versions.json")
+
+# Bump when the sample generator changes so existing files are rebuilt
+SAMPLE_GENERATOR_VERSION = 3
+
+def sample_version(indicator, dates):
+    """Return a short key identifying the inputs of an indicator's sample files."""
+    key = (f"{SAMPLE_GENERATOR_VERSION}-{dates[0]:%Y-%m}-{len(dates)}-"
+           f"{indicator['id']}-{indicator['base_value']}-{indicator['unit']}")
+    return hashlib.md5(key.encode()).hexdigest()[:8]
+
+def load_sample_versions():
+    """Load the recorded sample versions, or an empty dict if there are none."""
+    try:
+        with open(SAMPLE_VERSIONS_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_sample_versions(versions):
+    """Record the sample versions next to the generated files."""
+    try:
+        with open(SAMPLE_VERSIONS_FILE, 'w') as f:
+            json.dump(versions, f, indent=2, sort_keys=True)
+    except OSError as e:
+        logger.error(f"Error saving sample versions: {e}")
+
 def create_sample_data():
     """Create basic sample data files if none are found."""
     from datetime import datetime, timedelta
     import numpy as np
     import pandas as pd
+    from dashboard.utils.data_loader import sample_rng
     
     logger.info("Creating basic sample data files...")
     
@@ -156,81 +211,93 @@ def create_sample_data():
     dates = pd.date_range(start=start_date, end=end_date, freq='MS')
     
     created_count = 0
+    versions = load_sample_versions()
     
+    # Skip indicators whose files were generated for the same month and settings
+    pending = []
     for indicator in indicators:
-        # Generate sample values
-        np.random.seed(hash(indicator['id']) % 1000)  # Consistent randomness
-        
-        values = []
-        for i, date in enumerate(dates):
-            if i == 0:
-                value = indicator['base_value']
-            else:
-                # Add some randomness and trend
-                trend = 0.002  # Small upward trend
-                seasonal = 0.01 * np.sin(2 * np.pi * i / 12)  # Seasonal component
-                noise = np.random.normal(0, 0.01)  # Random noise
-                
-                value = values[-1] * (1 + trend + seasonal + noise)
-            values.append(value)
+        output_file = os.path.join("data", "processed", f"{indicator['id']}.csv")
+        forecast_file = os.path.join("data", "forecasts", f"{indicator['id']}_forecast.csv")
+        version = sample_version(indicator, dates)
+        if versions.get(indicator['id']) == version and os.path.exists(output_file) and os.path.exists(forecast_file):
+            logger.info(f"Sample data for {indicator['id']} is up to date")
+            continue
+        pending.append((indicator, output_file, forecast_file, version))
+    
+    if not pending:
+        return created_count
+    
+    # Seed each indicator from its id, like the dashboard's own sample data
+    rngs = [sample_rng(indicator['id']) for indicator, _, _, _ in pending]
+    bases = np.array([indicator['base_value'] for indicator, _, _, _ in pending], dtype=float)
+    
+    # Generate all series at once, one row per indicator: each month compounds
+    # a small upward trend, a seasonal component and random noise onto the
+    # previous value
+    n_months = len(dates)
+    steps = np.arange(n_months)
+    noise = np.stack([rng.normal(0, 0.01, n_months) for rng in rngs])
+    rates = 1 + 0.002 + 0.01 * np.sin(2 * np.pi * steps / 12) + noise
+    rates[:, 0] = 1.0
+    values = bases[:, None] * np.cumprod(rates, axis=1)
+    
+    # Percentage changes over one and twelve months
+    monthly_change = np.full_like(values, np.nan)
+    monthly_change[:, 1:] = (values[:, 1:] / values[:, :-1] - 1) * 100
+    yoy_change = np.full_like(values, np.nan)
+    yoy_change[:, 12:] = (values[:, 12:] / values[:, :-12] - 1) * 100
+    
+    # Forecasts continue from the last value; the first forecast month gets
+    # noise only, later months the trend too
+    forecast_dates = pd.date_range(start=end_date, periods=6, freq='MS')
+    forecast_rates = 1 + np.stack([rng.normal(0, 0.005, len(forecast_dates)) for rng in rngs])
+    forecast_rates[:, 1:] += 0.002
+    forecast_values = values[:, -1:] * np.cumprod(forecast_rates, axis=1)
+    
+    # Create confidence intervals that widen with the forecast horizon
+    horizon = np.arange(len(forecast_dates))
+    lower_ci = forecast_values * (1 - 0.01 - 0.005 * horizon)
+    upper_ci = forecast_values * (1 + 0.01 + 0.005 * horizon)
+    
+    # Split the rows into per-indicator files
+    for i, (indicator, output_file, forecast_file, version) in enumerate(pending):
+        preferred_direction = 'down' if 'cost' in indicator['id'] or indicator['id'] == 'supply_chain' else 'neutral'
         
-        # Create DataFrame
         df = pd.DataFrame({
             'Date': dates,
-            'value': values
+            'value': values[i],
+            'monthly_change': monthly_change[i],
+            'yoy_change': yoy_change[i],
+            'source': f"{indicator['name']} (Sample Data)",
+            'indicator_id': indicator['id'],
+            'unit': indicator['unit'],
+            'preferred_direction': preferred_direction,
+            'description': f"Sample data for {indicator['name']}"
         })
         
-        # Add calculated columns
-        df['monthly_change'] = df['value'].pct_change() * 100
-        df['yoy_change'] = df['value'].pct_change(12) * 100
-        
-        # Add metadata
-        df['source'] = f"{indicator['name']} (Sample Data)"
-        df['indicator_id'] = indicator['id']
-        df['unit'] = indicator['unit']
-        df['preferred_direction'] = 'down' if 'cost' in indicator['id'] or indicator['id'] == 'supply_chain' else 'neutral'
-        df['description'] = f"Sample data for {indicator['name']}"
-        
         # Save to processed dir
-        output_file = os.path.join("data", "processed", f"{indicator['id']}.csv")
         df.to_csv(output_file, index=False)
         logger.info(f"Created sample data file: {output_file}")
         created_count += 1
         
-        # Create forecast
-        forecast_dates = pd.date_range(start=end_date, periods=6, freq='MS')
-        last_value = df['value'].iloc[-1]
-        
-        forecast_values = []
-        for i in range(len(forecast_dates)):
-            if i == 0:
-                value = last_value * (1 + np.random.normal(0, 0.005))
-            else:
-                value = forecast_values[-1] * (1 + 0.002 + np.random.normal(0, 0.005))
-            forecast_values.append(value)
-        
-        # Create confidence intervals
-        lower_ci = [val * (1 - 0.01 - 0.005*i) for i, val in enumerate(forecast_values)]
-        upper_ci = [val * (1 + 0.01 + 0.005*i) for i, val in enumerate(forecast_values)]
-        
-        # Create forecast DataFrame
         forecast_df = pd.DataFrame({
             'Date': forecast_dates,
-            'value': forecast_values,
-            'lower_ci': lower_ci,
-            'upper_ci': upper_ci,
+            'value': forecast_values[i],
+            'lower_ci': lower_ci[i],
+            'upper_ci': upper_ci[i],
             'source': f"{indicator['name']} - FORECAST (Sample)",
             'indicator_id': indicator['id'],
             'unit': indicator['unit'],
-            'preferred_direction': 'down' if 'cost' in indicator['id'] or indicator['id'] == 'supply_chain' else 'neutral'
+            'preferred_direction': preferred_direction
         })
         
         # Save forecast
-        forecast_file = os.path.join("data", "forecasts", f"{indicator['id']}_forecast.csv")
         forecast_df.to_csv(forecast_file, index=False)
         logger.info(f"Created sample forecast file: {forecast_file}")
         created_count += 1
+        versions[indicator['id']] = version
     
+    save_sample_versions(versions)
     return created_count
 
 if __name__ == "__main__":